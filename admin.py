@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import re
 import unicodedata
 
 from datetime import datetime
 import uuid
 from pathlib import Path
-from types import SimpleNamespace
 
 from flask import current_app, redirect, request, url_for
 from flask_admin import Admin, AdminIndexView, expose
@@ -19,12 +19,14 @@ from flask_admin.menu import MenuLink
 from flask_admin.model.form import InlineFormAdmin
 from flask_login import current_user
 from flask_ckeditor import CKEditorField
-from sqlalchemy import select
+from sqlalchemy import event, or_, select
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import load_only
 from wtforms import HiddenField, PasswordField
 from wtforms.fields import EmailField
 from wtforms.validators import DataRequired, Email, EqualTo, Length, Optional
 
+from content_store import to_namespace
 from forms import PageForm
 import storage
 from models import (
@@ -56,6 +58,40 @@ SECTION_INLINE_FORM_COLUMNS = (
     "is_active",
 )
 
+# Comentário: expressões usadas para gerar slugs, compiladas uma única vez.
+_SLUG_INVALID_CHARS_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS_RE = re.compile(r"[-\s]+")
+
+# Comentário: chave em ``session.info`` com os arquivos de documentos que devem
+# ser apagados do Cloudinary quando a exclusão for confirmada.
+CLOUDINARY_CLEANUP_KEY = "cloudinary_document_cleanup"
+
+
+def _queue_cloudinary_cleanup(file_paths) -> None:
+    """Agenda a exclusão dos arquivos no Cloudinary para depois do commit."""
+
+    db.session.info.setdefault(CLOUDINARY_CLEANUP_KEY, []).extend(
+        path for path in file_paths if path
+    )
+
+
+def _queue_document_cleanup(file_paths_stmt) -> None:
+    """Agenda os arquivos dos documentos selecionados pela consulta informada."""
+
+    if storage.is_cloudinary_enabled():
+        _queue_cloudinary_cleanup(db.session.scalars(file_paths_stmt))
+
+
+def _delete_queued_cloudinary_files(session) -> None:
+    file_paths = session.info.pop(CLOUDINARY_CLEANUP_KEY, None)
+    if file_paths:
+        # Comentário: uma chamada em lote por até 100 arquivos, em vez de uma por documento.
+        storage.delete_cloudinary_assets(file_paths, resource_type="raw")
+
+
+def _discard_queued_cloudinary_files(session) -> None:
+    session.info.pop(CLOUDINARY_CLEANUP_KEY, None)
+
 
 SECTION_ITEM_PREVIEW_HTML = """
 <section class=\"section-item-preview\" data-section-item-preview>
@@ -244,23 +280,27 @@ class PageAdminView(SecuredModelView):
         value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode(
             "ascii"
         )
-        value = re.sub(r"[^\w\s-]", "", value).strip().lower()
-        return re.sub(r"[-\s]+", "-", value)
+        value = _SLUG_INVALID_CHARS_RE.sub("", value).strip().lower()
+        return _SLUG_SEPARATORS_RE.sub("-", value)
 
     def _ensure_unique_slug(self, model: Page) -> None:
         base_slug = self._slugify(model.slug or model.title)
         slug = base_slug or "pagina"
-        index = 2
 
-        while True:
-            query = Page.query.filter(Page.slug == slug)
-            if model.id:
-                query = query.filter(Page.id != model.id)
-            if query.first() is None:
-                model.slug = slug
-                break
+        # Comentário: busca de uma vez os slugs que podem colidir e escolhe o
+        # primeiro sufixo livre consultando um conjunto em memória.
+        stmt = select(Page.slug).where(
+            or_(Page.slug == slug, Page.slug.like(f"{base_slug}-%"))
+        )
+        if model.id:
+            stmt = stmt.where(Page.id != model.id)
+        taken = set(db.session.scalars(stmt))
+
+        index = 2
+        while slug in taken:
             slug = f"{base_slug}-{index}"
             index += 1
+        model.slug = slug
 
     def on_model_change(self, form, model: Page, is_created: bool) -> None:  # type: ignore[override]
         if not model.title:
@@ -284,15 +324,6 @@ class ProtectedAdminIndexView(AuthenticatedAdminMixin, AdminIndexView):
         kwargs.setdefault("name", self.name)
         super().__init__(*args, **kwargs)
 
-    def _to_namespace(self, data):
-        """Converte estruturas de dicionário em objetos com acesso por atributo."""
-
-        if isinstance(data, dict):
-            return SimpleNamespace(
-                **{key: self._to_namespace(value) for key, value in data.items()}
-            )
-        return data
-
     @expose("/")
     def index(self):  # type: ignore[override]
         """Exibe um painel inicial com atalhos e métricas úteis."""
@@ -321,7 +352,11 @@ class ProtectedAdminIndexView(AuthenticatedAdminMixin, AdminIndexView):
         )
 
         recent_pages = _safe_query(
-            lambda: Page.query.order_by(Page.id.desc()).limit(5).all(), []
+            lambda: Page.query.options(load_only(Page.id, Page.title, Page.visible))
+            .order_by(Page.id.desc())
+            .limit(5)
+            .all(),
+            [],
         )
         recent_sections = _safe_query(
             lambda: HomepageSection.query.order_by(HomepageSection.id.desc())
@@ -338,12 +373,13 @@ class ProtectedAdminIndexView(AuthenticatedAdminMixin, AdminIndexView):
             [],
         )
 
-        homepage_path = Path(current_app.root_path) / "templates" / "index.html"
-        homepage_last_modified = None
-        if homepage_path.exists():
+        homepage_path = os.path.join(current_app.root_path, "templates", "index.html")
+        try:
             homepage_last_modified = datetime.fromtimestamp(
-                homepage_path.stat().st_mtime
+                os.stat(homepage_path).st_mtime
             )
+        except OSError:
+            homepage_last_modified = None
 
         def _safe_url(endpoint: str, **values):
             try:
@@ -418,7 +454,7 @@ class ProtectedAdminIndexView(AuthenticatedAdminMixin, AdminIndexView):
                 }
             )
 
-        stats = self._to_namespace(
+        stats = to_namespace(
             {
                 "pages": {
                     "total": total_pages,
@@ -546,6 +582,16 @@ class HomepageSectionAdminView(SecuredModelView):
         )
     ]
 
+    def on_model_delete(self, model):  # type: ignore[override]
+        # Comentário: os documentos dos cartões são removidos pelo banco (ON DELETE
+        # CASCADE), então os arquivos são agendados antes da exclusão da seção.
+        _queue_document_cleanup(
+            select(Document.file_path)
+            .join(SectionItem, Document.section_item_id == SectionItem.id)
+            .where(SectionItem.section_id == model.id)
+        )
+        return super().on_model_delete(model)
+
 
 def _section_filter_options() -> list[tuple[int, str]]:
     """Retorna as opções disponíveis para o filtro de seção."""
@@ -630,9 +676,9 @@ class DocumentUploadMixin:
         upload_path.mkdir(parents=True, exist_ok=True)
         return upload_path
 
-    def _allowed_extensions(self) -> set[str]:
+    def _allowed_extensions(self) -> frozenset[str]:
         configured = current_app.config.get("DOCUMENTS_ALLOWED_EXTENSIONS") or {"pdf"}
-        return {ext.lower() for ext in configured}
+        return frozenset(ext.lower() for ext in configured)
 
     def _generate_filename(self, _model, file_data) -> str:
         extension = Path(file_data.filename or "").suffix.lower()
@@ -931,6 +977,12 @@ class SectionItemAdminView(SecuredModelView):
         form_class.id.validators = []
         return form_class
 
+    def on_model_delete(self, model):  # type: ignore[override]
+        _queue_document_cleanup(
+            select(Document.file_path).where(Document.section_item_id == model.id)
+        )
+        return super().on_model_delete(model)
+
 
 class DocumentAdminView(DocumentUploadMixin, SecuredModelView):
     """Gerencia os arquivos disponibilizados para download na página inicial."""
@@ -1005,7 +1057,7 @@ class DocumentAdminView(DocumentUploadMixin, SecuredModelView):
 
     def on_model_delete(self, model):  # type: ignore[override]
         if storage.is_cloudinary_enabled() and getattr(model, "file_path", None):
-            storage.delete_cloudinary_asset(model.file_path, resource_type="raw")
+            _queue_cloudinary_cleanup([model.file_path])
         return super().on_model_delete(model)
 
 
@@ -1238,6 +1290,10 @@ class UserAdminView(AdminOnlyMixin, ModelView):
 def init_admin(app) -> Admin:
     """Inicializa o painel administrativo integrado ao aplicativo Flask."""
 
+    if not event.contains(db.session, "after_commit", _delete_queued_cloudinary_files):
+        event.listen(db.session, "after_commit", _delete_queued_cloudinary_files)
+        event.listen(db.session, "after_rollback", _discard_queued_cloudinary_files)
+
     # Comentário: instancia o objeto Admin reutilizando a sessão do SQLAlchemy.
     admin = Admin(
         app,
@@ -4,17 +4,19 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from datetime import datetime
-import json
+from functools import lru_cache
 import os
 from pathlib import Path
 import shutil
 import subprocess
+import time
 from typing import Iterable
 import uuid
 import threading
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 
 import click
+
 from flask import (
     abort,
     flash,
@@ -30,6 +32,9 @@ from flask import (
     send_from_directory,
     url_for,
 )
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from flask_admin import helpers as admin_helpers
 from flask_migrate import Migrate
 from flask_ckeditor import CKEditor
@@ -42,15 +47,31 @@ from flask_login import (
 )
 from flask_babel import Babel
 from flask_socketio import SocketIO
-from sqlalchemy import create_engine, event, func, inspect, or_, text
+from sqlalchemy import (
+    create_engine,
+    event,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    text,
+    true,
+)
 from sqlalchemy.engine import make_url
-from sqlalchemy.orm import load_only
-from sqlalchemy.exc import IntegrityError, OperationalError
-from werkzeug.utils import secure_filename
+from sqlalchemy.orm import (
+    contains_eager,
+    joinedload,
+    load_only,
+    object_session,
+    selectinload,
+)
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
+from werkzeug.exceptions import RequestEntityTooLarge
 
+import content_store
 import storage
 
-from admin import init_admin
 from config import Config
 from forms import LoginForm, UserProfileForm
 
@@ -71,6 +92,218 @@ from jogo import jogo_bp, init_socketio
 # Comentário: extensões globais reutilizadas pela aplicação.
 STARTUP_EXTENSION_KEY = "orl_startup_state"
 
+# Comentário: chaves estrangeiras (tabela, coluna, tabela referenciada) que
+# apagam os registros filhos junto com o pai. Os relacionamentos usam
+# ``passive_deletes`` e dependem do ``ON DELETE CASCADE`` no banco.
+CASCADE_FOREIGN_KEYS = (
+    ("section_item", "section_id", "homepage_section"),
+    ("document", "section_item_id", "section_item"),
+    ("quick_link", "footer_column_id", "footer_column"),
+)
+
+# Comentário: SQLite não nomeia as chaves estrangeiras; a convenção permite que
+# o modo em lote do Alembic as encontre ao recriar a tabela.
+SQLITE_NAMING_CONVENTION = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+# Comentário: revisão do Alembic equivalente ao schema garantido por
+# ``ensure_database_schema`` em bancos criados sem migrações.
+SCHEMA_BASELINE_REVISION = "20240618_135700"
+
+# Comentário: intervalo para recalcular o ano exibido no rodapé.
+CURRENT_YEAR_TTL_SECONDS = 3600
+
+# Comentário: validade do menu em memória; alterações feitas neste processo
+# descartam o cache na hora, o prazo cobre as feitas por outros workers.
+VISIBLE_PAGES_TTL_SECONDS = 60
+
+# Comentário: validade dos atalhos e colunas do rodapé guardados em memória.
+NAVIGATION_CACHE_TTL_SECONDS = 60
+
+# Comentário: validade das seções e serviços da home guardados em memória.
+HOMEPAGE_CACHE_TTL_SECONDS = 300
+
+# Comentário: páginas de conteúdo fixo no formato (regra, endpoint, template).
+STATIC_CONTENT_ROUTES = (
+    # Editais e processos licitatórios.
+    ("/licitacoes", "licitacoes", "licitacoes/index.html"),
+    # Informações sobre concursos públicos vigentes.
+    ("/concursos", "concursos", "concursos.html"),
+    # Serviços disponíveis para o IPTU online.
+    ("/iptu-online", "iptu_online", "iptu_online.html"),
+    # Orientações sobre emissão e renovação de alvarás.
+    ("/alvaras", "alvaras", "alvaras.html"),
+    # Principais documentos do Plano Plurianual.
+    (
+        "/transparencia/plano-plurianual",
+        "plano_plurianual",
+        "transparencia/plano_plurianual.html",
+    ),
+    # Relatórios anuais de gestão do município.
+    (
+        "/transparencia/relatorios-gestao",
+        "relatorios_gestao",
+        "transparencia/relatorios_gestao.html",
+    ),
+    # Despesas realizadas no enfrentamento à COVID-19.
+    (
+        "/transparencia/gastos-covid-19",
+        "gastos_covid19",
+        "transparencia/gastos_covid19.html",
+    ),
+    # Formulários e resultados das pesquisas de satisfação.
+    (
+        "/transparencia/pesquisa-satisfacao",
+        "pesquisa_satisfacao",
+        "transparencia/pesquisa_satisfacao.html",
+    ),
+    # Obras públicas em andamento e concluídas.
+    (
+        "/transparencia/lista-obras",
+        "lista_obras",
+        "transparencia/lista_obras.html",
+    ),
+    # Relatórios e canais de atendimento da iluminação pública.
+    (
+        "/transparencia/iluminacao-publica",
+        "iluminacao_publica",
+        "transparencia/iluminacao_publica.html",
+    ),
+)
+
+# Comentário: rotas públicas cujo HTML é idêntico para todos os visitantes e
+# que, portanto, podem ser armazenadas em cache por navegadores e proxies.
+PUBLIC_CACHEABLE_ENDPOINTS = frozenset(
+    {"index"} | {endpoint for _, endpoint, _ in STATIC_CONTENT_ROUTES}
+)
+
+# Comentário: serviços de emergência cadastrados em instalações novas. A
+# estrutura é imutável; use ``dict(servico)`` caso precise alterar um valor.
+DEFAULT_EMERGENCY_SERVICES = tuple(
+    MappingProxyType(service)
+    for service in (
+        {
+            "name": "SAMU",
+            "phone": "192",
+            "icon_class": "fas fa-ambulance",
+        },
+        {
+            "name": "Bombeiros",
+            "phone": "193",
+            "icon_class": "fas fa-fire-extinguisher",
+        },
+        {
+            "name": "Polícia Militar",
+            "phone": "190",
+            "icon_class": "fas fa-shield-alt",
+        },
+        {
+            "name": "Pronto Socorro",
+            "phone": "(16) 3820-2000",
+            "icon_class": "fas fa-hospital",
+        },
+    )
+)
+
+# Comentário: atalhos exibidos enquanto nenhum link foi cadastrado no painel,
+# no formato (rótulo, endpoint).
+DEFAULT_QUICK_ACCESS_LINKS = (
+    ("Editais e Licitações", "licitacoes"),
+    ("Concursos Públicos", "concursos"),
+    ("IPTU Online", "iptu_online"),
+    ("Alvarás", "alvaras"),
+)
+DEFAULT_FOOTER_LINKS = (
+    ("Licitações", "licitacoes"),
+    ("Concursos", "concursos"),
+    ("IPTU Online", "iptu_online"),
+    ("Alvarás", "alvaras"),
+)
+
+# Comentário: folga para os cabeçalhos do multipart ao comparar o
+# Content-Length da requisição com o tamanho máximo da imagem.
+MULTIPART_OVERHEAD_ALLOWANCE = 64 * 1024
+
+
+@lru_cache(maxsize=32)
+def _column_bounds(total: int, columns: int) -> tuple[tuple[int, int], ...]:
+    """Calcula os intervalos de cada coluna do menu para ``total`` itens."""
+
+    columns = max(1, columns)
+    per_column = max(1, (total + columns - 1) // columns)
+    return tuple(
+        (start, min(start + per_column, total))
+        for start in range(0, total, per_column)
+    )
+
+
+def _query_has_rows(query) -> bool:
+    """Verifica com ``EXISTS`` se a consulta retorna ao menos uma linha."""
+
+    return bool(db.session.query(query.exists()).scalar())
+
+
+# Comentário: contadores incrementados a cada commit que altera os modelos de
+# cada grupo; os caches em memória comparam o número para saber se estão vencidos.
+_CONTENT_GENERATIONS = {"pages": 0, "homepage": 0, "navigation": 0}
+
+_CONTENT_GROUP_BY_MODEL = {
+    Page: "pages",
+    HomepageSection: "homepage",
+    SectionItem: "homepage",
+    EmergencyService: "homepage",
+    FooterColumn: "navigation",
+    QuickLink: "navigation",
+}
+
+
+def _mark_content_changed(_mapper, _connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_content", set()).add(
+            _CONTENT_GROUP_BY_MODEL[type(target)]
+        )
+
+
+def _content_committed(session) -> None:
+    for group in session.info.pop("changed_content", ()):
+        _bump_content_generation(group)
+
+
+def _content_rolled_back(session) -> None:
+    session.info.pop("changed_content", None)
+
+
+def _bump_content_generation(group: str) -> None:
+    """Invalida os caches em memória do grupo informado."""
+
+    _CONTENT_GENERATIONS[group] += 1
+
+
+def _listen_for_content_changes() -> None:
+    """Registra uma única vez os eventos que invalidam os caches em memória."""
+
+    if event.contains(Page, "after_insert", _mark_content_changed):
+        return
+    for model in _CONTENT_GROUP_BY_MODEL:
+        for event_name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, event_name, _mark_content_changed)
+    event.listen(db.session, "after_commit", _content_committed)
+    event.listen(db.session, "after_rollback", _content_rolled_back)
+
+
+def _snapshot(instance, *extra_attributes: str) -> SimpleNamespace:
+    """Copia as colunas carregadas de um objeto do ORM para um objeto simples."""
+
+    values = {
+        attribute.key: getattr(instance, attribute.key)
+        for attribute in inspect(instance).mapper.column_attrs
+    }
+    for name in extra_attributes:
+        values[name] = getattr(instance, name)
+    return SimpleNamespace(**values)
+
 
 migrate = Migrate()
 ckeditor = CKEditor()
@@ -85,14 +318,17 @@ def create_app() -> Flask:
     app = Flask(__name__)
     app.config.from_object(Config)
 
-    def _database_connect_timeout() -> int:
-        value = os.getenv("DATABASE_CONNECT_TIMEOUT")
-        if not value:
-            return 5
-        try:
-            return max(int(value), 1)
-        except (TypeError, ValueError):
-            return 5
+    # Comentário: ``_allowed_extension`` compara a extensão já em minúsculas,
+    # então os conjuntos configurados são normalizados uma única vez aqui.
+    for extensions_key in (
+        "CKEDITOR_ALLOWED_IMAGE_EXTENSIONS",
+        "SECTION_ITEM_ALLOWED_IMAGE_EXTENSIONS",
+        "DOCUMENTS_ALLOWED_EXTENSIONS",
+    ):
+        if app.config.get(extensions_key):
+            app.config[extensions_key] = frozenset(
+                extension.lower() for extension in app.config[extensions_key]
+            )
 
     def _test_database_connection(database_uri: str) -> None:
         if not database_uri:
@@ -103,7 +339,7 @@ def create_app() -> Flask:
         connect_args: dict[str, object] = {}
 
         if url.drivername.startswith("postgresql"):
-            connect_args["connect_timeout"] = _database_connect_timeout()
+            connect_args["connect_timeout"] = app.config["DATABASE_CONNECT_TIMEOUT"]
 
         if connect_args:
             engine_kwargs["connect_args"] = connect_args
@@ -162,9 +398,15 @@ def create_app() -> Flask:
     login_manager.login_message = "Realize o login para acessar o painel."
     login_manager.login_message_category = "error"
 
-    socketio.init_app(app)
+    # Comentário: com REDIS_URL definido, os eventos do jogo são distribuídos
+    # entre todos os workers pela fila de mensagens do Redis.
+    redis_url = app.config.get("REDIS_URL")
+    if redis_url:
+        socketio.init_app(app, message_queue=redis_url)
+    else:
+        socketio.init_app(app)
     if not getattr(socketio, "_orl_game_initialized", False):
-        init_socketio(socketio)
+        init_socketio(socketio, redis_url)
         setattr(socketio, "_orl_game_initialized", True)
 
     def _select_locale() -> str:
@@ -247,6 +489,111 @@ def create_app() -> Flask:
         event.listen(db.session, "before_flush", _audit_before_flush)
         db.session._audit_listener_configured = True
 
+    _listen_for_content_changes()
+
+    def _ensure_cascading_foreign_keys(engine) -> None:
+        """Recria com ``ON DELETE CASCADE`` as chaves criadas por versões antigas.
+
+        ``db.create_all`` não altera tabelas existentes e as colunas adicionadas
+        por ``ALTER TABLE`` nem chegam a ter chave estrangeira.
+        """
+
+        inspector = inspect(engine)
+        pending = []
+        for table, column, referred_table in CASCADE_FOREIGN_KEYS:
+            try:
+                foreign_keys = [
+                    foreign_key
+                    for foreign_key in inspector.get_foreign_keys(table)
+                    if foreign_key["constrained_columns"] == [column]
+                ]
+            except Exception:  # pragma: no cover - tabela inexistente
+                continue
+            if foreign_keys and all(
+                (foreign_key.get("options") or {}).get("ondelete", "").upper()
+                == "CASCADE"
+                for foreign_key in foreign_keys
+            ):
+                continue
+            pending.append((table, column, referred_table, foreign_keys))
+
+        if not pending:
+            return
+
+        try:
+            if engine.dialect.name == "sqlite":
+                with engine.connect() as connection:
+                    # Comentário: o PRAGMA só tem efeito fora de uma transação e
+                    # evita que recriar section_item afete os documentos ligados.
+                    connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+                    connection.commit()
+                    try:
+                        with connection.begin():
+                            operations = Operations(
+                                MigrationContext.configure(connection)
+                            )
+                            for table, column, referred_table, foreign_keys in pending:
+                                name = f"fk_{table}_{column}_{referred_table}"
+                                with operations.batch_alter_table(
+                                    table,
+                                    recreate="always",
+                                    naming_convention=SQLITE_NAMING_CONVENTION,
+                                ) as batch_op:
+                                    if foreign_keys:
+                                        batch_op.drop_constraint(
+                                            name, type_="foreignkey"
+                                        )
+                                    batch_op.create_foreign_key(
+                                        name,
+                                        referred_table,
+                                        [column],
+                                        ["id"],
+                                        ondelete="CASCADE",
+                                    )
+                    finally:
+                        connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+                        connection.commit()
+            else:
+                with engine.begin() as connection:
+                    for table, column, referred_table, foreign_keys in pending:
+                        for foreign_key in foreign_keys:
+                            if foreign_key["name"]:
+                                connection.execute(
+                                    text(
+                                        f"ALTER TABLE {table} DROP CONSTRAINT "
+                                        f"{foreign_key['name']}"
+                                    )
+                                )
+                        connection.execute(
+                            text(
+                                f"ALTER TABLE {table} ADD CONSTRAINT "
+                                f"{table}_{column}_fkey FOREIGN KEY ({column}) "
+                                f"REFERENCES {referred_table} (id) ON DELETE CASCADE"
+                            )
+                        )
+        except SQLAlchemyError:
+            app.logger.exception(
+                "Falha ao recriar as chaves estrangeiras com ON DELETE CASCADE."
+            )
+
+    def _stamp_schema_baseline(engine) -> None:
+        """Registra a revisão base do Alembic em bancos criados por ``db.create_all``.
+
+        Sem ``alembic_version``, ``flask db upgrade`` tentaria reaplicar a
+        primeira migração (colunas que ``ensure_database_schema`` já cria).
+        """
+
+        if inspect(engine).has_table("alembic_version"):
+            return
+
+        script = ScriptDirectory(
+            str(Path(app.root_path) / app.extensions["migrate"].directory)
+        )
+        with engine.begin() as connection:
+            MigrationContext.configure(connection).stamp(
+                script, SCHEMA_BASELINE_REVISION
+            )
+
     def ensure_database_schema() -> None:
         """Garante a existência das colunas esperadas em instalações antigas."""
 
@@ -401,10 +748,19 @@ def create_app() -> Flask:
                         )
                     )
 
+        _ensure_cascading_foreign_keys(engine)
+        _stamp_schema_baseline(engine)
+
+    # Comentário: caminho resolvido uma única vez, na criação da aplicação.
+    homepage_content_path = Path(
+        app.config.get("HOMEPAGE_CONTENT_PATH")
+        or Path(app.root_path) / "content" / "homepage.json"
+    )
+
     def ensure_homepage_sections() -> None:
         """Carrega um conteúdo inicial da home quando o banco está vazio."""
 
-        data_file = Path(app.root_path) / "content" / "homepage.json"
+        data_file = homepage_content_path
         if not data_file.exists():
             return
 
@@ -414,7 +770,7 @@ def create_app() -> Flask:
             return
 
         try:
-            has_sections = HomepageSection.query.count() > 0
+            has_sections = _query_has_rows(HomepageSection.query)
         except OperationalError:
             # Comentário: tabelas ainda não foram criadas.
             return
@@ -422,95 +778,101 @@ def create_app() -> Flask:
         if has_sections:
             return
 
-        raw_data = json.loads(data_file.read_text(encoding="utf-8"))
+        raw_data = content_store.load_content(data_file)
         sections_data = raw_data.get("sections", [])
+        if not sections_data:
+            return
 
-        for order, section_data in enumerate(sections_data):
-            section = HomepageSection(
-                name=section_data.get("title", "Seção"),
-                slug=section_data.get("id", f"secao-{order}"),
-                description=section_data.get("description"),
-                section_type=section_data.get("id", "custom"),
-                display_order=order,
-                is_active=True,
+        section_rows = [
+            {
+                "name": section_data.get("title", "Seção"),
+                "slug": section_data.get("id", f"secao-{order}"),
+                "description": section_data.get("description"),
+                "section_type": section_data.get("id", "custom"),
+                "display_order": order,
+                "is_active": True,
+            }
+            for order, section_data in enumerate(sections_data)
+        ]
+
+        # Comentário: inserção em lote; os ids retornados são associados pelo
+        # slug, que é único, para montar os itens de cada seção.
+        section_ids = {
+            row.slug: row.id
+            for row in db.session.execute(
+                insert(HomepageSection).returning(
+                    HomepageSection.id, HomepageSection.slug
+                ),
+                section_rows,
             )
-            db.session.add(section)
+        }
 
+        item_rows = []
+        for section_row, section_data in zip(section_rows, sections_data):
             default_label = "Acessar"
-            if section.section_type == "news":
+            if section_row["section_type"] == "news":
                 default_label = "Leia mais"
-            elif section.section_type == "transparency":
+            elif section_row["section_type"] == "transparency":
                 default_label = "Consultar"
 
+            section_id = section_ids[section_row["slug"]]
             for item_order, item_data in enumerate(section_data.get("items", [])):
-                item = SectionItem(
-                    section=section,
-                    title=item_data.get("title", "Item"),
-                    summary=item_data.get("description"),
-                    link_url=item_data.get("url"),
-                    link_label=item_data.get("link_label") or default_label,
-                    icon_class=item_data.get("icon"),
-                    image_url=item_data.get("image"),
-                    badge=item_data.get("badge"),
-                    display_date=item_data.get("date"),
-                    display_order=item_order,
-                    is_active=True,
+                item_rows.append(
+                    {
+                        "section_id": section_id,
+                        "title": item_data.get("title", "Item"),
+                        "summary": item_data.get("description"),
+                        "link_url": item_data.get("url"),
+                        "link_label": item_data.get("link_label") or default_label,
+                        "icon_class": item_data.get("icon"),
+                        "image_url": item_data.get("image"),
+                        "badge": item_data.get("badge"),
+                        "display_date": item_data.get("date"),
+                        "display_order": item_order,
+                        "is_active": True,
+                    }
                 )
-                db.session.add(item)
+
+        if item_rows:
+            db.session.execute(insert(SectionItem), item_rows)
 
         db.session.commit()
+        # Comentário: INSERTs em lote não disparam os eventos do ORM que
+        # invalidam o cache da home, por isso a invalidação é explícita.
+        _bump_content_generation("homepage")
 
     def ensure_emergency_services() -> None:
         """Popula serviços de emergência padrão em instalações novas."""
 
-        defaults = [
-            {
-                "name": "SAMU",
-                "phone": "192",
-                "icon_class": "fas fa-ambulance",
-            },
-            {
-                "name": "Bombeiros",
-                "phone": "193",
-                "icon_class": "fas fa-fire-extinguisher",
-            },
-            {
-                "name": "Polícia Militar",
-                "phone": "190",
-                "icon_class": "fas fa-shield-alt",
-            },
-            {
-                "name": "Pronto Socorro",
-                "phone": "(16) 3820-2000",
-                "icon_class": "fas fa-hospital",
-            },
-        ]
-
         try:
             db.create_all()
         except OperationalError:
             return
 
         try:
-            has_services = EmergencyService.query.count() > 0
+            has_services = _query_has_rows(EmergencyService.query)
         except OperationalError:
             return
 
         if has_services:
             return
 
-        for order, data in enumerate(defaults):
-            db.session.add(
-                EmergencyService(
-                    name=data.get("name", "Serviço"),
-                    phone=data.get("phone"),
-                    icon_class=data.get("icon_class"),
-                    display_order=order,
-                    is_active=True,
-                )
-            )
-
+        # Comentário: os serviços padrão são gravados em um único INSERT em lote.
+        db.session.execute(
+            insert(EmergencyService),
+            [
+                {
+                    "name": data.get("name", "Serviço"),
+                    "phone": data.get("phone"),
+                    "icon_class": data.get("icon_class"),
+                    "display_order": order,
+                    "is_active": True,
+                }
+                for order, data in enumerate(DEFAULT_EMERGENCY_SERVICES)
+            ],
+        )
         db.session.commit()
+        _bump_content_generation("homepage")
 
     def ensure_default_admin_user() -> None:
         """Cria automaticamente o usuário administrador inicial."""
@@ -674,8 +1036,34 @@ def create_app() -> Flask:
             ensure_homepage_sections()
             ensure_emergency_services()
 
+        # Comentário: importado aqui para que módulos que só precisam de
+        # ``app.py`` indiretamente não carreguem a pilha do Flask-Admin.
+        from admin import init_admin
+
         init_admin(app)
 
+        if not app.config.get("AUTO_BOOTSTRAP"):
+            # Comentário: em produção o schema e os dados iniciais são
+            # garantidos uma única vez pelo comando ``flask ensure-default-data``
+            # (fase "release" do Procfile), e não por cada worker.
+            try:
+                missing_tables = set(db.metadata.tables) - set(
+                    inspect(db.engine).get_table_names()
+                )
+            except OperationalError:
+                missing_tables = set()
+            if missing_tables:
+                # Comentário: ex.: ``python app.py`` sem FLASK_DEBUG não cria o
+                # schema; sem este aviso a aplicação falharia sem explicação.
+                app.logger.warning(
+                    "AUTO_BOOTSTRAP desativado e as tabelas %s não existem. "
+                    "Execute 'flask ensure-default-data' ou defina FLASK_DEBUG=1 "
+                    "(ou AUTO_BOOTSTRAP=1) para criá-las ao iniciar.",
+                    ", ".join(sorted(missing_tables)),
+                )
+            state["executed"] = True
+            return
+
         if app.config.get("STARTUP_TASKS_ASYNC"):
             def _run_in_background() -> None:
                 with app.app_context():
@@ -773,21 +1161,75 @@ def create_app() -> Flask:
         admin_view = admin_ext[0].index_view if admin_ext else None
         return render_template("admin/profile.html", form=form, admin_view=admin_view)
 
+    upload_paths_cache: dict[tuple[str, str | Path], Path] = {}
+
     def _resolve_upload_path(config_key: str, default_path: str | Path) -> Path:
         upload_path_value = app.config.get(config_key, default_path)
+        # Comentário: a pasta é resolvida e criada apenas na primeira chamada
+        # para cada configuração; as seguintes reutilizam o mesmo ``Path``.
+        cache_key = (config_key, upload_path_value)
+        upload_path = upload_paths_cache.get(cache_key)
+        if upload_path is not None:
+            return upload_path
+
         upload_path = Path(upload_path_value)
         if not upload_path.is_absolute():
             upload_path = Path(app.root_path) / upload_path
         upload_path.mkdir(parents=True, exist_ok=True)
+        upload_paths_cache[cache_key] = upload_path
         return upload_path
 
-    def _allowed_file(filename: str, allowed_extensions) -> bool:
-        if not filename or "." not in filename:
+    def _cdn_upload_url(relative_path: str) -> str | None:
+        """Monta a URL pública do arquivo quando uma CDN serve ``static/uploads``."""
+
+        cdn_base_url = (app.config.get("CDN_BASE_URL") or "").rstrip("/")
+        if not cdn_base_url:
+            return None
+        return f"{cdn_base_url}/{relative_path}"
+
+    def _allowed_extension(filename: str | None, allowed_extensions) -> str | None:
+        """Retorna a extensão do arquivo quando ela está entre as permitidas.
+
+        O nome salvo é sempre gerado com ``uuid``; por isso basta validar a
+        extensão, sem sanitizar o nome original enviado pelo usuário.
+        """
+
+        extension = os.path.splitext(filename or "")[1][1:].lower()
+        if not extension or extension not in (allowed_extensions or ()):
+            return None
+        return extension
+
+    def _request_exceeds_upload_limit(max_size: int | None) -> bool:
+        """Recusa envios grandes pelo cabeçalho, antes de processar o multipart."""
+
+        if not max_size:
             return False
 
-        allowed = {ext.lower() for ext in (allowed_extensions or set())}
-        extension = filename.rsplit(".", 1)[1].lower()
-        return extension in allowed
+        limit = max_size + MULTIPART_OVERHEAD_ALLOWANCE
+        # Comentário: faz o Werkzeug abortar a leitura do corpo quando o
+        # cliente não informa o Content-Length (transferência em partes).
+        request.max_content_length = limit
+        content_length = request.content_length
+        return content_length is not None and content_length > limit
+
+    def _image_too_large_response(max_size: int):
+        limit_mb = max_size / (1024 * 1024)
+        limit_text = (
+            f"{int(limit_mb)} MB"
+            if float(limit_mb).is_integer()
+            else f"{limit_mb:.1f} MB"
+        )
+        return (
+            jsonify(
+                {
+                    "uploaded": 0,
+                    "error": {
+                        "message": f"Imagem excede o tamanho máximo permitido de {limit_text}.",
+                    },
+                }
+            ),
+            413,
+        )
 
     @app.route("/admin/ckeditor/uploads/<path:filename>")
     def ckeditor_uploaded_file(filename: str):
@@ -798,17 +1240,27 @@ def create_app() -> Flask:
 
     @app.route("/admin/ckeditor/upload", methods=["POST"])
     def upload_ckeditor_image():
-        upload = request.files.get("upload")
+        max_size = app.config.get("CKEDITOR_MAX_IMAGE_SIZE")
+        if _request_exceeds_upload_limit(max_size):
+            return _image_too_large_response(max_size)
+
+        try:
+            upload = request.files.get("upload")
+        except RequestEntityTooLarge:
+            # Comentário: envio em partes que ultrapassou ``max_content_length``;
+            # responde em JSON para o CKEditor exibir a mensagem.
+            return _image_too_large_response(max_size)
         if upload is None or upload.filename == "":
             return (
                 jsonify({"uploaded": 0, "error": {"message": "Nenhum arquivo foi enviado."}}),
                 400,
             )
 
-        if not _allowed_file(
+        extension = _allowed_extension(
             upload.filename,
-            app.config.get("CKEDITOR_ALLOWED_IMAGE_EXTENSIONS", set()),
-        ):
+            app.config.get("CKEDITOR_ALLOWED_IMAGE_EXTENSIONS", frozenset()),
+        )
+        if extension is None:
             return (
                 jsonify(
                     {
@@ -821,38 +1273,14 @@ def create_app() -> Flask:
                 400,
             )
 
-        max_size = app.config.get("CKEDITOR_MAX_IMAGE_SIZE")
         if max_size:
+            # Comentário: verificação complementar para envios sem Content-Length.
             upload.stream.seek(0, os.SEEK_END)
             file_size = upload.stream.tell()
             upload.stream.seek(0)
             if file_size > max_size:
-                limit_mb = max_size / (1024 * 1024)
-                limit_text = (
-                    f"{int(limit_mb)} MB"
-                    if float(limit_mb).is_integer()
-                    else f"{limit_mb:.1f} MB"
-                )
-                return (
-                    jsonify(
-                        {
-                            "uploaded": 0,
-                            "error": {
-                                "message": f"Imagem excede o tamanho máximo permitido de {limit_text}.",
-                            },
-                        }
-                    ),
-                    413,
-                )
+                return _image_too_large_response(max_size)
 
-        secure_name = secure_filename(upload.filename)
-        if not secure_name:
-            return (
-                jsonify({"uploaded": 0, "error": {"message": "Nome de arquivo inválido."}}),
-                400,
-            )
-
-        extension = secure_name.rsplit(".", 1)[1].lower()
         unique_name = f"ckeditor-{uuid.uuid4().hex}.{extension}"
 
         if storage.is_cloudinary_enabled():
@@ -885,7 +1313,9 @@ def create_app() -> Flask:
             destination = upload_path / unique_name
             upload.save(destination)
 
-            file_url = url_for("ckeditor_uploaded_file", filename=unique_name)
+            file_url = _cdn_upload_url(unique_name) or url_for(
+                "ckeditor_uploaded_file", filename=unique_name
+            )
         return jsonify({"uploaded": 1, "fileName": unique_name, "url": file_url})
 
     @app.route("/admin/section-item/uploads/<path:filename>")
@@ -899,7 +1329,16 @@ def create_app() -> Flask:
     @app.route("/admin/section-item/upload-image", methods=["POST"])
     @login_required
     def upload_section_item_image():
-        upload = request.files.get("upload")
+        max_size = app.config.get("SECTION_ITEM_MAX_IMAGE_SIZE")
+        if _request_exceeds_upload_limit(max_size):
+            return _image_too_large_response(max_size)
+
+        try:
+            upload = request.files.get("upload")
+        except RequestEntityTooLarge:
+            # Comentário: envio em partes que ultrapassou ``max_content_length``;
+            # responde em JSON para o CKEditor exibir a mensagem.
+            return _image_too_large_response(max_size)
         if upload is None or upload.filename == "":
             return (
                 jsonify(
@@ -910,9 +1349,10 @@ def create_app() -> Flask:
 
         allowed_extensions = app.config.get(
             "SECTION_ITEM_ALLOWED_IMAGE_EXTENSIONS",
-            app.config.get("CKEDITOR_ALLOWED_IMAGE_EXTENSIONS", set()),
+            app.config.get("CKEDITOR_ALLOWED_IMAGE_EXTENSIONS", frozenset()),
         )
-        if not _allowed_file(upload.filename, allowed_extensions):
+        extension = _allowed_extension(upload.filename, allowed_extensions)
+        if extension is None:
             return (
                 jsonify(
                     {
@@ -925,38 +1365,14 @@ def create_app() -> Flask:
                 400,
             )
 
-        max_size = app.config.get("SECTION_ITEM_MAX_IMAGE_SIZE")
         if max_size:
+            # Comentário: verificação complementar para envios sem Content-Length.
             upload.stream.seek(0, os.SEEK_END)
             file_size = upload.stream.tell()
             upload.stream.seek(0)
             if file_size > max_size:
-                limit_mb = max_size / (1024 * 1024)
-                limit_text = (
-                    f"{int(limit_mb)} MB"
-                    if float(limit_mb).is_integer()
-                    else f"{limit_mb:.1f} MB"
-                )
-                return (
-                    jsonify(
-                        {
-                            "uploaded": 0,
-                            "error": {
-                                "message": f"Imagem excede o tamanho máximo permitido de {limit_text}.",
-                            },
-                        }
-                    ),
-                    413,
-                )
-
-        secure_name = secure_filename(upload.filename)
-        if not secure_name:
-            return (
-                jsonify({"uploaded": 0, "error": {"message": "Nome de arquivo inválido."}}),
-                400,
-            )
+                return _image_too_large_response(max_size)
 
-        extension = secure_name.rsplit(".", 1)[1].lower()
         unique_name = f"section-item-{uuid.uuid4().hex}.{extension}"
 
         if storage.is_cloudinary_enabled():
@@ -990,100 +1406,182 @@ def create_app() -> Flask:
             destination = upload_path / unique_name
             upload.save(destination)
 
-            file_url = url_for("section_item_uploaded_image", filename=unique_name)
+            file_url = _cdn_upload_url(f"section-items/{unique_name}") or url_for(
+                "section_item_uploaded_image", filename=unique_name
+            )
 
         return jsonify({"uploaded": 1, "fileName": unique_name, "url": file_url})
 
-    def _chunk_pages(pages: Iterable[Page], columns: int = 3) -> list[list[Page]]:
-        pages = list(pages)
+    def _chunk_pages(pages: Iterable, columns: int = 3) -> list[list]:
+        if not isinstance(pages, list):
+            pages = list(pages)
         if not pages:
             return []
 
-        columns = max(1, columns)
-        per_column = max(1, (len(pages) + columns - 1) // columns)
-        return [pages[i : i + per_column] for i in range(0, len(pages), per_column)]
+        return [
+            pages[start:stop] for start, stop in _column_bounds(len(pages), columns)
+        ]
+
+    # Comentário: [instante da última leitura (monotônico), geração, páginas do menu].
+    visible_pages_cache: list = [float("-inf"), -1, []]
 
-    @app.context_processor
-    def inject_navigation_pages() -> dict[str, object]:
-        """Disponibiliza as páginas e links auxiliares em todos os templates."""
+    def _load_visible_pages() -> list[SimpleNamespace]:
+        """Retorna as páginas do menu principal, consultando o banco só quando preciso."""
+
+        now = time.monotonic()
+        generation = _CONTENT_GENERATIONS["pages"]
+        if (
+            visible_pages_cache[1] == generation
+            and now - visible_pages_cache[0] <= VISIBLE_PAGES_TTL_SECONDS
+        ):
+            return visible_pages_cache[2]
 
         try:
-            visible_pages = (
-                Page.query.options(
-                    # Carrega apenas os campos usados na navegação para evitar
-                    # transferir o conteúdo HTML pesado de cada página.
-                    load_only(Page.id, Page.slug, Page.title, Page.visible)
-                )
-                .filter_by(visible=True)
+            rows = (
+                db.session.query(Page.id, Page.slug, Page.title, Page.visible)
+                .filter(Page.visible.is_(True))
                 .order_by(Page.title)
                 .all()
             )
         except OperationalError:
             # Comentário: primeira execução pode ocorrer antes da criação das tabelas.
-            visible_pages = []
+            return []
 
-        admin_navigation: OrderedDict[str, list[dict[str, str]]] = OrderedDict()
-        admin_index_url = None
+        # Comentário: objetos simples podem ser compartilhados entre requisições
+        # sem ficarem presos à sessão do banco que os carregou.
+        pages = [
+            SimpleNamespace(id=row.id, slug=row.slug, title=row.title, visible=row.visible)
+            for row in rows
+        ]
+        visible_pages_cache[:] = [now, generation, pages]
+        return pages
 
-        admin_ext = app.extensions.get("admin", [])
-        if admin_ext:
-            admin = admin_ext[0]
-            for view in admin._views:
-                endpoint = getattr(view, "endpoint", None)
-                if not endpoint:
-                    continue
+    # Comentário: [instante da última leitura (monotônico), geração, seções, serviços].
+    homepage_cache: list = [float("-inf"), -1, [], []]
 
-                view_endpoint = f"{endpoint}.index_view"
-                try:
-                    view_url = url_for(view_endpoint)
-                except Exception:  # pragma: no cover - fallback seguro
-                    continue
+    def _load_homepage_content() -> tuple[list[SimpleNamespace], list[SimpleNamespace]]:
+        """Retorna seções e serviços da home, guardados em memória entre requisições."""
 
-                if endpoint == "admin":
-                    admin_index_url = view_url
+        now = time.monotonic()
+        generation = _CONTENT_GENERATIONS["homepage"]
+        if (
+            homepage_cache[1] == generation
+            and now - homepage_cache[0] <= HOMEPAGE_CACHE_TTL_SECONDS
+        ):
+            return homepage_cache[2], homepage_cache[3]
 
-                category = view.category or "Painel administrativo"
-                admin_navigation.setdefault(category, []).append(
-                    {"name": view.name, "url": view_url}
+        try:
+            sections = (
+                HomepageSection.query.options(
+                    # Comentário: carrega os cartões de todas as seções em uma
+                    # única consulta extra, em vez de uma por seção no template.
+                    selectinload(HomepageSection.items)
                 )
+                .filter_by(is_active=True)
+                .order_by(
+                    HomepageSection.display_order.asc(),
+                    HomepageSection.id.asc(),
+                )
+                .all()
+            )
+            services = (
+                EmergencyService.query.filter_by(is_active=True)
+                .order_by(
+                    EmergencyService.display_order.asc(),
+                    EmergencyService.name.asc(),
+                )
+                .all()
+            )
+        except OperationalError:
+            return [], []
+
+        # Comentário: a árvore vira objetos simples para poder ser reutilizada
+        # depois que a sessão que carregou os modelos é encerrada.
+        section_snapshots = []
+        for section in sections:
+            snapshot = _snapshot(section)
+            snapshot.items = [
+                _snapshot(item, "image_transform_css") for item in section.items
+            ]
+            section_snapshots.append(snapshot)
+        service_snapshots = [_snapshot(service) for service in services]
 
-        if admin_index_url is None:
-            try:
-                admin_index_url = url_for("admin.index")
-            except Exception:  # pragma: no cover - rota indisponível
-                admin_index_url = None
+        homepage_cache[:] = [now, generation, section_snapshots, service_snapshots]
+        return section_snapshots, service_snapshots
+
+    # Comentário: [instante da última leitura (monotônico), ano calculado].
+    current_year_cache: list = [float("-inf"), 0]
+
+    def _current_year() -> int:
+        """Retorna o ano corrente, recalculado no máximo uma vez por hora."""
+
+        now = time.monotonic()
+        if now - current_year_cache[0] > CURRENT_YEAR_TTL_SECONDS:
+            current_year_cache[1] = datetime.utcnow().year
+            current_year_cache[0] = now
+        return current_year_cache[1]
+
+    default_links_cache: dict[str, tuple[dict[str, str], ...]] = {}
+
+    def _default_links(
+        key: str, definitions: tuple[tuple[str, str], ...]
+    ) -> tuple[dict[str, str], ...]:
+        """Resolve uma única vez as URLs dos links padrão do menu e rodapé."""
+
+        links = default_links_cache.get(key)
+        if links is None:
+            links = tuple(
+                {"label": label, "url": url_for(endpoint)}
+                for label, endpoint in definitions
+            )
+            default_links_cache[key] = links
+        return links
+
+    # Comentário: [instante da última leitura (monotônico), geração, atalhos, rodapé].
+    navigation_cache: list = [float("-inf"), -1, [], []]
+
+    def _load_navigation_links() -> tuple[list, list[dict[str, object]]]:
+        """Retorna os atalhos e as colunas do rodapé, guardados em memória."""
+
+        now = time.monotonic()
+        generation = _CONTENT_GENERATIONS["navigation"]
+        if (
+            navigation_cache[1] == generation
+            and now - navigation_cache[0] <= NAVIGATION_CACHE_TTL_SECONDS
+        ):
+            return navigation_cache[2], navigation_cache[3]
 
         try:
-            quick_access_links = (
-                QuickLink.query.filter(
+            # Comentário: os links do menu e do rodapé são consultados apenas com
+            # as colunas usadas nos templates, sem montar objetos do ORM. O filtro
+            # usa ``= true`` (e não ``IS TRUE``) para casar com os índices parciais
+            # ``WHERE is_active`` do PostgreSQL.
+            quick_access_links = db.session.execute(
+                select(QuickLink.label, QuickLink.url)
+                .where(
                     QuickLink.location == QuickLink.LOCATION_QUICK_ACCESS,
-                    QuickLink.is_active.isnot(False),
+                    QuickLink.is_active == true(),
                 )
                 .order_by(QuickLink.display_order.asc(), QuickLink.id.asc())
-                .all()
-            )
-            quick_access_configured = (
-                QuickLink.query.filter_by(location=QuickLink.LOCATION_QUICK_ACCESS).count()
-                > 0
+            ).all()
+            quick_access_configured = bool(quick_access_links) or _query_has_rows(
+                QuickLink.query.filter_by(location=QuickLink.LOCATION_QUICK_ACCESS)
             )
         except OperationalError:
             quick_access_links = []
             quick_access_configured = False
 
         if not quick_access_links and not quick_access_configured:
-            quick_access_links = [
-                {"label": "Editais e Licitações", "url": url_for("licitacoes")},
-                {"label": "Concursos Públicos", "url": url_for("concursos")},
-                {"label": "IPTU Online", "url": url_for("iptu_online")},
-                {"label": "Alvarás", "url": url_for("alvaras")},
-            ]
+            quick_access_links = _default_links(
+                "quick_access", DEFAULT_QUICK_ACCESS_LINKS
+            )
 
         try:
-            footer_columns = (
-                FooterColumn.query.filter(FooterColumn.is_active.isnot(False))
+            footer_columns = db.session.execute(
+                select(FooterColumn.id, FooterColumn.title)
+                .where(FooterColumn.is_active == true())
                 .order_by(FooterColumn.display_order.asc(), FooterColumn.id.asc())
-                .all()
-            )
+            ).all()
         except OperationalError:
             footer_columns = []
 
@@ -1094,21 +1592,23 @@ def create_app() -> Flask:
 
             if column_ids:
                 try:
-                    footer_links = (
-                        QuickLink.query.filter(
+                    footer_links = db.session.execute(
+                        select(
+                            QuickLink.footer_column_id, QuickLink.label, QuickLink.url
+                        )
+                        .where(
                             QuickLink.location == QuickLink.LOCATION_FOOTER,
-                            QuickLink.is_active.isnot(False),
+                            QuickLink.is_active == true(),
                             QuickLink.footer_column_id.in_(column_ids),
                         )
                         .order_by(QuickLink.display_order.asc(), QuickLink.id.asc())
-                        .all()
-                    )
+                    ).all()
                 except OperationalError:
                     footer_links = []
             else:
                 footer_links = []
 
-            links_by_column: dict[int | None, list[QuickLink]] = {
+            links_by_column: dict[int | None, list] = {
                 column_id: [] for column_id in column_ids
             }
             for link in footer_links:
@@ -1123,20 +1623,17 @@ def create_app() -> Flask:
                 )
         else:
             try:
-                legacy_footer_links = (
-                    QuickLink.query.filter(
+                legacy_footer_links = db.session.execute(
+                    select(QuickLink.label, QuickLink.url)
+                    .where(
                         QuickLink.location == QuickLink.LOCATION_FOOTER,
-                        QuickLink.is_active.isnot(False),
+                        QuickLink.is_active == true(),
                         QuickLink.footer_column_id.is_(None),
                     )
                     .order_by(QuickLink.display_order.asc(), QuickLink.id.asc())
-                    .all()
-                )
-                legacy_configured = (
-                    QuickLink.query.filter_by(
-                        location=QuickLink.LOCATION_FOOTER
-                    ).count()
-                    > 0
+                ).all()
+                legacy_configured = bool(legacy_footer_links) or _query_has_rows(
+                    QuickLink.query.filter_by(location=QuickLink.LOCATION_FOOTER)
                 )
             except OperationalError:
                 legacy_footer_links = []
@@ -1150,12 +1647,7 @@ def create_app() -> Flask:
                 footer_columns_payload = [
                     {
                         "title": "Serviços online",
-                        "links": [
-                            {"label": "Licitações", "url": url_for("licitacoes")},
-                            {"label": "Concursos", "url": url_for("concursos")},
-                            {"label": "IPTU Online", "url": url_for("iptu_online")},
-                            {"label": "Alvarás", "url": url_for("alvaras")},
-                        ],
+                        "links": _default_links("footer", DEFAULT_FOOTER_LINKS),
                     }
                 ]
             else:
@@ -1163,6 +1655,55 @@ def create_app() -> Flask:
                     {"title": "Serviços online", "links": []}
                 ]
 
+        # Comentário: as linhas retornadas pelo select() não dependem da sessão e
+        # podem ser compartilhadas entre requisições.
+        navigation_cache[:] = [
+            now,
+            generation,
+            quick_access_links,
+            footer_columns_payload,
+        ]
+        return quick_access_links, footer_columns_payload
+
+    @app.context_processor
+    def inject_navigation_pages() -> dict[str, object]:
+        """Disponibiliza as páginas e links auxiliares em todos os templates."""
+
+        visible_pages = _load_visible_pages()
+
+        admin_navigation: OrderedDict[str, list[dict[str, str]]] = OrderedDict()
+        admin_index_url = None
+
+        admin_ext = app.extensions.get("admin", [])
+        if admin_ext:
+            admin = admin_ext[0]
+            for view in admin._views:
+                endpoint = getattr(view, "endpoint", None)
+                if not endpoint:
+                    continue
+
+                view_endpoint = f"{endpoint}.index_view"
+                try:
+                    view_url = url_for(view_endpoint)
+                except Exception:  # pragma: no cover - fallback seguro
+                    continue
+
+                if endpoint == "admin":
+                    admin_index_url = view_url
+
+                category = view.category or "Painel administrativo"
+                admin_navigation.setdefault(category, []).append(
+                    {"name": view.name, "url": view_url}
+                )
+
+        if admin_index_url is None:
+            try:
+                admin_index_url = url_for("admin.index")
+            except Exception:  # pragma: no cover - rota indisponível
+                admin_index_url = None
+
+        quick_access_links, footer_columns_payload = _load_navigation_links()
+
         return {
             "pages": visible_pages,
             "page_columns": _chunk_pages(visible_pages, columns=3),
@@ -1170,37 +1711,36 @@ def create_app() -> Flask:
             "admin_index_url": admin_index_url,
             "footer_columns": footer_columns_payload,
             "quick_access_links": quick_access_links,
-            "current_year": datetime.utcnow().year,
+            "current_year": _current_year(),
         }
 
+    @app.after_request
+    def add_cache_headers(response):
+        """Permite que navegadores e CDNs reutilizem as páginas públicas estáticas."""
+
+        if (
+            request.method not in {"GET", "HEAD"}
+            or request.endpoint not in PUBLIC_CACHEABLE_ENDPOINTS
+            or response.status_code != 200
+            or response.direct_passthrough
+            or current_user.is_authenticated
+        ):
+            return response
+
+        max_age = app.config.get("PUBLIC_PAGES_CACHE_MAX_AGE")
+        if not max_age:
+            return response
+
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        response.add_etag()
+        return response.make_conditional(request)
+
     @app.route("/")
     def index() -> str:
         """Rota principal que exibe a página inicial estática."""
 
-        try:
-            sections = (
-                HomepageSection.query.filter_by(is_active=True)
-                .order_by(
-                    HomepageSection.display_order.asc(),
-                    HomepageSection.id.asc(),
-                )
-                .all()
-            )
-        except OperationalError:
-            sections = []
-
-        try:
-            emergency_services = (
-                EmergencyService.query.filter_by(is_active=True)
-                .order_by(
-                    EmergencyService.display_order.asc(),
-                    EmergencyService.name.asc(),
-                )
-                .all()
-            )
-        except OperationalError:
-            emergency_services = []
-
+        sections, emergency_services = _load_homepage_content()
         return render_template(
             "index.html",
             sections=sections,
@@ -1219,7 +1759,12 @@ def create_app() -> Flask:
 
         try:
             page_results = (
-                Page.query.filter(Page.visible.is_(True))
+                # Comentário: o HTML é carregado inteiro porque cortá-lo antes do
+                # striptags pode partir uma tag (ex.: imagens em data URI).
+                Page.query.options(
+                    load_only(Page.id, Page.slug, Page.title, Page.content)
+                )
+                .filter(Page.visible.is_(True))
                 .filter(
                     or_(
                         Page.title.ilike(search_pattern),
@@ -1235,6 +1780,9 @@ def create_app() -> Flask:
         try:
             section_item_results = (
                 SectionItem.query.join(HomepageSection)
+                # Comentário: reaproveita o JOIN para preencher item.section, usado
+                # no template, sem uma consulta extra por resultado.
+                .options(contains_eager(SectionItem.section))
                 .filter(
                     HomepageSection.is_active.is_(True),
                     SectionItem.is_active.is_(True),
@@ -1259,6 +1807,11 @@ def create_app() -> Flask:
             document_results = (
                 Document.query.join(SectionItem)
                 .join(HomepageSection)
+                .options(
+                    contains_eager(Document.section_item).contains_eager(
+                        SectionItem.section
+                    )
+                )
                 .filter(
                     Document.is_active.is_(True),
                     SectionItem.is_active.is_(True),
@@ -1289,12 +1842,26 @@ def create_app() -> Flask:
             total_results=total_results,
         )
 
+    def _load_section_item_detail(item_id: int) -> SectionItem | None:
+        """Carrega um cartão com a seção e os documentos usados nas páginas de detalhe."""
+
+        # Comentário: a seção vem no mesmo SELECT e os documentos em uma única
+        # consulta extra, que usa o índice (section_item_id, display_order, id).
+        return db.session.get(
+            SectionItem,
+            item_id,
+            options=[
+                joinedload(SectionItem.section),
+                selectinload(SectionItem.documents),
+            ],
+        )
+
     @app.route("/destaques/<int:item_id>")
     def home_item_detail(item_id: int) -> str:
         """Exibe uma página detalhada para itens das seções da página inicial."""
 
         try:
-            item = SectionItem.query.get(item_id)
+            item = _load_section_item_detail(item_id)
         except OperationalError:
             abort(404)
 
@@ -1306,72 +1873,27 @@ def create_app() -> Flask:
 
         return render_template("home_item_detail.html", item=item)
 
-    @app.route("/licitacoes")
-    def licitacoes() -> str:
-        """Disponibiliza a página com os editais e processos licitatórios."""
-
-        return render_template("licitacoes/index.html")
-
-    @app.route("/concursos")
-    def concursos() -> str:
-        """Exibe as informações sobre concursos públicos vigentes."""
-
-        return render_template("concursos.html")
-
-    @app.route("/iptu-online")
-    def iptu_online() -> str:
-        """Apresenta os serviços disponíveis para o IPTU online."""
-
-        return render_template("iptu_online.html")
-
-    @app.route("/alvaras")
-    def alvaras() -> str:
-        """Fornece orientações sobre emissão e renovação de alvarás."""
-
-        return render_template("alvaras.html")
-
-    @app.route("/transparencia/plano-plurianual")
-    def plano_plurianual() -> str:
-        """Disponibiliza os principais documentos do Plano Plurianual."""
-
-        return render_template("transparencia/plano_plurianual.html")
+    def render_static_content(_template: str) -> str:
+        """Renderiza as páginas de conteúdo fixo listadas em ``STATIC_CONTENT_ROUTES``."""
 
-    @app.route("/transparencia/relatorios-gestao")
-    def relatorios_gestao() -> str:
-        """Apresenta os relatórios anuais de gestão do município."""
+        return render_template(_template)
 
-        return render_template("transparencia/relatorios_gestao.html")
-
-    @app.route("/transparencia/gastos-covid-19")
-    def gastos_covid19() -> str:
-        """Exibe dados sobre despesas realizadas no enfrentamento à COVID-19."""
-
-        return render_template("transparencia/gastos_covid19.html")
-
-    @app.route("/transparencia/pesquisa-satisfacao")
-    def pesquisa_satisfacao() -> str:
-        """Disponibiliza formulários e resultados das pesquisas de satisfação."""
-
-        return render_template("transparencia/pesquisa_satisfacao.html")
-
-    @app.route("/transparencia/lista-obras")
-    def lista_obras() -> str:
-        """Reúne as informações das obras públicas em andamento e concluídas."""
-
-        return render_template("transparencia/lista_obras.html")
-
-    @app.route("/transparencia/iluminacao-publica")
-    def iluminacao_publica() -> str:
-        """Traz relatórios e canais de atendimento da iluminação pública."""
-
-        return render_template("transparencia/iluminacao_publica.html")
+    # Comentário: uma única função atende todas as rotas de conteúdo fixo; o
+    # template chega pelos ``defaults`` da regra, sem uma closure por rota.
+    for rule, endpoint, template_name in STATIC_CONTENT_ROUTES:
+        app.add_url_rule(
+            rule,
+            endpoint,
+            render_static_content,
+            defaults={"_template": template_name},
+        )
 
     @app.route("/noticias/<int:item_id>")
     def news_detail(item_id: int) -> str:
         """Mostra o conteúdo completo de uma notícia cadastrada na home."""
 
         try:
-            item = SectionItem.query.get(item_id)
+            item = _load_section_item_detail(item_id)
         except OperationalError:
             abort(404)
 
@@ -1411,13 +1933,54 @@ def create_app() -> Flask:
     @click.option("--port", default=5000, help="Porta em que o servidor ficará disponível.")
     @click.option("--debug/--no-debug", default=True, help="Ativa ou não o modo debug.")
     def bootstrap_app(host: str, port: int, debug: bool) -> None:
-        """Cria o banco de dados (caso não exista) e inicia a aplicação."""
+        """Cria o banco de dados e os dados iniciais (caso não existam) e inicia a aplicação."""
 
         with app.app_context():
             ensure_database_schema()
+            ensure_default_admin_user()
+            ensure_homepage_sections()
+            ensure_emergency_services()
             click.echo("Banco de dados verificado com sucesso.")
         app.run(host=host, port=port, debug=debug)
 
+    def _warm_caches() -> None:
+        """Antecipa o custo da primeira requisição após um deploy.
+
+        Compila os templates mais acessados e executa as consultas do menu e
+        da página inicial, abrindo a conexão do pool e populando o cache de
+        instruções do SQLAlchemy enquanto a aplicação aguarda tráfego.
+        """
+
+        startup_thread = app.extensions.get(STARTUP_EXTENSION_KEY, {}).get("thread")
+        if startup_thread is not None:
+            startup_thread.join()
+
+        with app.app_context():
+            try:
+                for template_name in ("base.html", "index.html"):
+                    app.jinja_env.get_template(template_name)
+                _load_visible_pages()
+                _load_homepage_content()
+            except Exception:  # pragma: no cover - log defensivo
+                app.logger.warning(
+                    "Falha ao pré-carregar caches da aplicação.", exc_info=True
+                )
+            finally:
+                db.session.remove()
+
+    # Comentário: comandos do Flask CLI (``flask db upgrade``, ``flask
+    # ensure-default-data``...) também criam a aplicação; neles o pré-carregamento
+    # só disputaria bloqueios com as alterações de schema.
+    if (
+        app.config.get("STARTUP_CACHE_WARMUP")
+        and click.get_current_context(silent=True) is None
+    ):
+        threading.Thread(
+            target=_warm_caches,
+            name="orl-cache-warmup",
+            daemon=True,
+        ).start()
+
     return app
 
 
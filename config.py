@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import sys
 from pathlib import Path
 from urllib.parse import (
@@ -16,6 +17,13 @@ from urllib.parse import (
 from urllib.parse import splitport
 
 
+# Comentário: cópia única das variáveis de ambiente lidas pela configuração.
+_ENV = dict(os.environ)
+
+# Comentário: caracteres de URL que dispensam qualquer normalização.
+_ASCII_CLEAN_URL_RE = re.compile(r"[A-Za-z0-9._~%:/?=&+,@-]*")
+
+
 def _encode_host(host: str | None) -> str:
     """Garante que o host esteja em ASCII utilizando IDNA quando possível."""
 
@@ -70,12 +78,38 @@ def _encode_fragment(fragment: str) -> str:
     return quote(unquote(fragment), safe="")
 
 
+def _unsplit_without_host(parts, original_url: str) -> str:
+    """Remonta URLs sem host (ex.: ``sqlite:////tmp/x.db``) preservando o ``//``.
+
+    ``urlunsplit`` só escreve ``//`` para esquemas conhecidos; para ``sqlite`` ele
+    transformaria ``sqlite:////tmp/x.db`` em ``sqlite://tmp/x.db``.
+    """
+
+    if parts.netloc or not original_url.startswith(f"{parts.scheme}://"):
+        return urlunsplit(parts)
+
+    url = f"{parts.scheme}://{parts.path}"
+    if parts.query:
+        url = f"{url}?{parts.query}"
+    if parts.fragment:
+        url = f"{url}#{parts.fragment}"
+    return url
+
+
 def _repair_surrogates(value: str) -> str:
     """Reinterpreta variáveis com caracteres substitutos oriundos do Windows."""
 
     # Comentário: em ambientes Windows, variáveis com caracteres fora de ASCII
     # podem chegar como "surrogateescape" (\udc80-\udcff). Reconstruímos os
     # bytes originais e decodificamos usando codificações compatíveis.
+    try:
+        # Comentário: caminho rápido, feito em C, para textos sem substitutos.
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        pass
+    else:
+        return value
+
     if not any("\udc80" <= char <= "\udcff" for char in value):
         return value
 
@@ -89,123 +123,123 @@ def _repair_surrogates(value: str) -> str:
     return raw_bytes.decode("utf-8", "ignore")
 
 
-class Config:
-    """Configuração padrão com valores voltados ao ambiente local."""
-
-    # Comentário: o diretório base é calculado para facilitar o uso em qualquer SO.
-    BASE_DIR = Path(__file__).resolve().parent
-
-    # Comentário: localização padrão utilizada por Babel e Flask-Admin.
-    BABEL_DEFAULT_LOCALE = "pt_BR"
-    BABEL_DEFAULT_TIMEZONE = "America/Sao_Paulo"
-
-    # Comentário: caminho para o banco SQLite armazenado na pasta do projeto.
-    _database_url_raw = os.getenv("DATABASE_URL")
-    _database_url = (
-        _repair_surrogates(_database_url_raw)
-        if isinstance(_database_url_raw, str)
-        else _database_url_raw
-    )
-    _normalize_database_url = os.getenv("DATABASE_URL_NORMALIZE", "1").lower() not in {
-        "0",
-        "false",
-        "no",
-        "off",
-    }
+def _normalized_database_url(database_url: str) -> str:
+    """Normaliza a URL de banco para lidar com credenciais não ASCII."""
 
-    def _normalized_database_url(database_url: str) -> str:
-        """Normaliza a URL de banco para lidar com credenciais não ASCII."""
+    if database_url.startswith("postgres://"):
+        database_url = database_url.replace(
+            "postgres://", "postgresql+psycopg2://", 1
+        )
 
-        if database_url.startswith("postgres://"):
-            database_url = database_url.replace(
-                "postgres://", "postgresql+psycopg2://", 1
-            )
+    # Comentário: caminho rápido para URLs ASCII sem caracteres que exijam
+    # codificação (caso comum, como as geradas pelo Heroku).
+    if database_url.count("@") <= 1 and _ASCII_CLEAN_URL_RE.fullmatch(database_url):
+        return database_url
 
-        parsed = urlsplit(database_url)
-        if "@" not in parsed.netloc:
-            host, port = splitport(parsed.netloc)
-            ascii_host = _encode_host(host)
-            if ascii_host == host:
-                path = _encode_path(parsed.path)
-                query = _encode_query(parsed.query)
-                fragment = _encode_fragment(parsed.fragment)
-                normalized = parsed._replace(path=path, query=query, fragment=fragment)
-                return urlunsplit(normalized)
-            path = _encode_path(parsed.path)
-            query = _encode_query(parsed.query)
-            fragment = _encode_fragment(parsed.fragment)
-            netloc = _combine_host_port(ascii_host, port)
-            normalized = parsed._replace(netloc=netloc, path=path, query=query, fragment=fragment)
-            return urlunsplit(normalized)
-
-        userinfo, hostinfo = parsed.netloc.rsplit("@", 1)
-        if not userinfo:
-            host, port = splitport(hostinfo)
-            ascii_host = _encode_host(host)
+    parsed = urlsplit(database_url)
+    if "@" not in parsed.netloc:
+        host, port = splitport(parsed.netloc)
+        ascii_host = _encode_host(host)
+        if ascii_host == host:
             path = _encode_path(parsed.path)
             query = _encode_query(parsed.query)
             fragment = _encode_fragment(parsed.fragment)
-            netloc = _combine_host_port(ascii_host, port)
-            normalized = parsed._replace(netloc=netloc, path=path, query=query, fragment=fragment)
-            return urlunsplit(normalized)
-
-        if ":" in userinfo:
-            raw_username, raw_password = userinfo.split(":", 1)
-        else:
-            raw_username, raw_password = userinfo, None
-
-        username = unquote(raw_username)
-        password = unquote(raw_password) if raw_password is not None else None
-
-        encoded_username = quote(username, safe="")
-        encoded_password = (
-            quote(password, safe="") if password is not None else None
-        )
-
-        if encoded_username == raw_username and (
-            raw_password is None or encoded_password == raw_password
-        ):
-            return database_url
-
-        new_userinfo = encoded_username
-        if encoded_password is not None:
-            new_userinfo = f"{new_userinfo}:{encoded_password}"
+            normalized = parsed._replace(path=path, query=query, fragment=fragment)
+            return _unsplit_without_host(normalized, database_url)
+        path = _encode_path(parsed.path)
+        query = _encode_query(parsed.query)
+        fragment = _encode_fragment(parsed.fragment)
+        netloc = _combine_host_port(ascii_host, port)
+        normalized = parsed._replace(netloc=netloc, path=path, query=query, fragment=fragment)
+        return urlunsplit(normalized)
 
+    userinfo, hostinfo = parsed.netloc.rsplit("@", 1)
+    if not userinfo:
         host, port = splitport(hostinfo)
         ascii_host = _encode_host(host)
-        new_netloc = f"{new_userinfo}@{_combine_host_port(ascii_host, port)}"
         path = _encode_path(parsed.path)
         query = _encode_query(parsed.query)
         fragment = _encode_fragment(parsed.fragment)
-        normalized = parsed._replace(
-            netloc=new_netloc, path=path, query=query, fragment=fragment
-        )
+        netloc = _combine_host_port(ascii_host, port)
+        normalized = parsed._replace(netloc=netloc, path=path, query=query, fragment=fragment)
         return urlunsplit(normalized)
 
+    if ":" in userinfo:
+        raw_username, raw_password = userinfo.split(":", 1)
+    else:
+        raw_username, raw_password = userinfo, None
+
+    username = unquote(raw_username)
+    password = unquote(raw_password) if raw_password is not None else None
+
+    encoded_username = quote(username, safe="")
+    encoded_password = (
+        quote(password, safe="") if password is not None else None
+    )
+
+    if encoded_username == raw_username and (
+        raw_password is None or encoded_password == raw_password
+    ):
+        return database_url
+
+    new_userinfo = encoded_username
+    if encoded_password is not None:
+        new_userinfo = f"{new_userinfo}:{encoded_password}"
+
+    host, port = splitport(hostinfo)
+    ascii_host = _encode_host(host)
+    new_netloc = f"{new_userinfo}@{_combine_host_port(ascii_host, port)}"
+    path = _encode_path(parsed.path)
+    query = _encode_query(parsed.query)
+    fragment = _encode_fragment(parsed.fragment)
+    normalized = parsed._replace(
+        netloc=new_netloc, path=path, query=query, fragment=fragment
+    )
+    return urlunsplit(normalized)
+
+
+def _database_url_from_env(name: str, normalize: bool) -> str | None:
+    """Lê a URL de banco da variável ``name`` reparando e normalizando o valor."""
 
-    if _database_url and _normalize_database_url:
+    raw_value = _ENV.get(name)
+    if not isinstance(raw_value, str):
+        return raw_value
+
+    database_url = _repair_surrogates(raw_value)
+    if database_url and normalize:
         try:
-            _database_url = _normalized_database_url(_database_url)
+            database_url = _normalized_database_url(database_url)
         except Exception:
             # Comentário: se ocorrer qualquer erro durante a normalização,
             # retomamos a URL original para não impedir a aplicação de iniciar.
-            _database_url = _database_url_raw
+            return raw_value
+    return database_url
 
-    _fallback_database_url_raw = os.getenv("LOCAL_DATABASE_URL")
-    _fallback_database_url = (
-        _repair_surrogates(_fallback_database_url_raw)
-        if isinstance(_fallback_database_url_raw, str)
-        else _fallback_database_url_raw
-    )
 
-    if _fallback_database_url and _normalize_database_url:
-        try:
-            _fallback_database_url = _normalized_database_url(
-                _fallback_database_url
-            )
-        except Exception:
-            _fallback_database_url = _fallback_database_url_raw
+class Config:
+    """Configuração padrão com valores voltados ao ambiente local."""
+
+    # Comentário: o diretório base é calculado para facilitar o uso em qualquer SO.
+    BASE_DIR = Path(__file__).resolve().parent
+
+    # Comentário: localização padrão utilizada por Babel e Flask-Admin.
+    BABEL_DEFAULT_LOCALE = "pt_BR"
+    BABEL_DEFAULT_TIMEZONE = "America/Sao_Paulo"
 
+    # Comentário: URLs de banco informadas pelo ambiente, já reparadas e
+    # normalizadas uma única vez durante a importação do módulo.
+    _normalize_database_url = _ENV.get("DATABASE_URL_NORMALIZE", "1").lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+    _database_url = _database_url_from_env("DATABASE_URL", _normalize_database_url)
+    _fallback_database_url = _database_url_from_env(
+        "LOCAL_DATABASE_URL", _normalize_database_url
+    )
+
+    # Comentário: caminho para o banco SQLite armazenado na pasta do projeto.
     DEFAULT_SQLITE_PATH = BASE_DIR / "project.db"
 
     SQLALCHEMY_FALLBACK_DATABASE_URI = (
@@ -216,28 +250,57 @@ class Config:
         _database_url or SQLALCHEMY_FALLBACK_DATABASE_URI
     )
 
+    # Comentário: tempo máximo (em segundos) para abrir a conexão de teste com o
+    # PostgreSQL antes de recorrer ao banco alternativo.
+    try:
+        DATABASE_CONNECT_TIMEOUT = max(
+            int(_ENV.get("DATABASE_CONNECT_TIMEOUT", "5")), 1
+        )
+    except ValueError:
+        DATABASE_CONNECT_TIMEOUT = 5
+
     # Comentário: chave secreta utilizada para sessões e formulários.
-    SECRET_KEY = os.getenv("SECRET_KEY", "prefeitura-orlandia")
+    SECRET_KEY = _ENV.get("SECRET_KEY", "prefeitura-orlandia")
 
     # Comentário: configuração silenciosa do SQLAlchemy para evitar warnings desnecessários.
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {"pool_pre_ping": True}
+    # Comentário: cache de SQL compilado do SQLAlchemy, ampliado para comportar as
+    # variações de consultas do site e do painel sem recompilar a cada requisição.
+    try:
+        _query_cache_size = max(
+            int(_ENV.get("SQLALCHEMY_QUERY_CACHE_SIZE", "1200")), 0
+        )
+    except ValueError:
+        _query_cache_size = 1200
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "query_cache_size": _query_cache_size,
+    }
+
+    # Comentário: tempo (em segundos) que navegadores e CDNs podem reutilizar as
+    # páginas públicas sem consultar a aplicação. Use 0 para desativar.
+    try:
+        PUBLIC_PAGES_CACHE_MAX_AGE = max(
+            int(_ENV.get("PUBLIC_PAGES_CACHE_MAX_AGE", "60")), 0
+        )
+    except ValueError:
+        PUBLIC_PAGES_CACHE_MAX_AGE = 60
 
     # Comentário: parâmetros opcionais para o serviço externo de armazenamento.
-    CLOUDINARY_URL = os.getenv("CLOUDINARY_URL")
-    CLOUDINARY_CKEDITOR_FOLDER = os.getenv(
+    CLOUDINARY_URL = _ENV.get("CLOUDINARY_URL")
+    CLOUDINARY_CKEDITOR_FOLDER = _ENV.get(
         "CLOUDINARY_CKEDITOR_FOLDER", "orl/ckeditor"
     )
-    CLOUDINARY_DOCUMENTS_FOLDER = os.getenv(
+    CLOUDINARY_DOCUMENTS_FOLDER = _ENV.get(
         "CLOUDINARY_DOCUMENTS_FOLDER", "orl/documents"
     )
-    CLOUDINARY_SECTION_ITEM_FOLDER = os.getenv(
+    CLOUDINARY_SECTION_ITEM_FOLDER = _ENV.get(
         "CLOUDINARY_SECTION_ITEM_FOLDER", "orl/section-items"
     )
 
     # Comentário: credenciais de acesso ao painel administrativo.
-    ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
-    ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "senha-segura")
+    ADMIN_USERNAME = _ENV.get("ADMIN_USERNAME", "admin")
+    ADMIN_PASSWORD = _ENV.get("ADMIN_PASSWORD", "senha-segura")
 
     # Comentário: ajustes globais do CKEditor para oferecer uma experiência completa.
     CKEDITOR_PKG_TYPE = "full"
@@ -245,11 +308,13 @@ class Config:
     CKEDITOR_HEIGHT = 400
     CKEDITOR_FILE_UPLOADER = "upload_ckeditor_image"
     CKEDITOR_UPLOADS_PATH = str(BASE_DIR / "static" / "uploads")
-    CKEDITOR_ALLOWED_IMAGE_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
+    CKEDITOR_ALLOWED_IMAGE_EXTENSIONS = frozenset(
+        {"png", "jpg", "jpeg", "gif", "webp"}
+    )
     _ckeditor_max_image_size_default = 20 * 1024 * 1024  # 20 MB
     try:
         CKEDITOR_MAX_IMAGE_SIZE = int(
-            os.getenv(
+            _ENV.get(
                 "CKEDITOR_MAX_IMAGE_SIZE",
                 str(_ckeditor_max_image_size_default),
             )
@@ -260,11 +325,13 @@ class Config:
     SECTION_ITEM_IMAGE_UPLOADS_PATH = str(
         BASE_DIR / "static" / "uploads" / "section-items"
     )
-    SECTION_ITEM_ALLOWED_IMAGE_EXTENSIONS = {"png", "jpg", "jpeg", "gif", "webp"}
+    SECTION_ITEM_ALLOWED_IMAGE_EXTENSIONS = frozenset(
+        {"png", "jpg", "jpeg", "gif", "webp"}
+    )
     _section_item_max_image_size_default = 5 * 1024 * 1024  # 5 MB
     try:
         SECTION_ITEM_MAX_IMAGE_SIZE = int(
-            os.getenv(
+            _ENV.get(
                 "SECTION_ITEM_MAX_IMAGE_SIZE",
                 str(_section_item_max_image_size_default),
             )
@@ -272,34 +339,59 @@ class Config:
     except ValueError:
         SECTION_ITEM_MAX_IMAGE_SIZE = _section_item_max_image_size_default
 
+    # Comentário: conteúdo inicial utilizado para popular a página inicial.
+    HOMEPAGE_CONTENT_PATH = str(BASE_DIR / "content" / "homepage.json")
+
+    # Comentário: endereço público (CDN ou servidor web) que expõe a pasta
+    # ``static/uploads``. Quando definido, as imagens enviadas sem Cloudinary
+    # são referenciadas diretamente por ele, sem passar pelo Flask.
+    CDN_BASE_URL = _ENV.get("CDN_BASE_URL")
+
+    # Comentário: Redis compartilhado pelo jogo (estado das salas e fila do Socket.IO).
+    REDIS_URL = _ENV.get("REDIS_URL")
+
     # Comentário: diretório e tipos aceitos para os documentos publicados no site.
     DOCUMENTS_UPLOAD_PATH = str(BASE_DIR / "static" / "uploads" / "documents")
-    DOCUMENTS_ALLOWED_EXTENSIONS = {
-        "pdf",
-        "doc",
-        "docx",
-        "xls",
-        "xlsx",
-        "ppt",
-        "pptx",
-        "odt",
-        "ods",
-        "odp",
-        "zip",
-    }
+    DOCUMENTS_ALLOWED_EXTENSIONS = frozenset(
+        {
+            "pdf",
+            "doc",
+            "docx",
+            "xls",
+            "xlsx",
+            "ppt",
+            "pptx",
+            "odt",
+            "ods",
+            "odp",
+            "zip",
+        }
+    )
 
-    _startup_tasks_async_env = os.getenv("STARTUP_TASKS_ASYNC")
-    if _startup_tasks_async_env is None or _startup_tasks_async_env.lower() == "auto":
-        STARTUP_TASKS_ASYNC = os.getenv("FLASK_DEBUG", "").lower() in {
-            "1",
-            "true",
-            "yes",
-            "on",
+    # Comentário: controla se cada processo da aplicação verifica schema e dados
+    # iniciais ao iniciar. Em "auto", isso só ocorre em desenvolvimento; em
+    # produção utilize ``flask ensure-default-data`` uma vez a cada deploy.
+    _development_mode = _ENV.get("FLASK_DEBUG", "").lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    } or _ENV.get("FLASK_ENV", "").lower() == "development"
+
+    _auto_bootstrap_env = _ENV.get("AUTO_BOOTSTRAP")
+    if _auto_bootstrap_env is None or _auto_bootstrap_env.lower() == "auto":
+        AUTO_BOOTSTRAP = _development_mode
+    else:
+        AUTO_BOOTSTRAP = _auto_bootstrap_env.lower() not in {
+            "0",
+            "false",
+            "no",
+            "off",
         }
-        if not STARTUP_TASKS_ASYNC:
-            STARTUP_TASKS_ASYNC = (
-                os.getenv("FLASK_ENV", "").lower() == "development"
-            )
+
+    _startup_tasks_async_env = _ENV.get("STARTUP_TASKS_ASYNC")
+    if _startup_tasks_async_env is None or _startup_tasks_async_env.lower() == "auto":
+        STARTUP_TASKS_ASYNC = _development_mode
     else:
         STARTUP_TASKS_ASYNC = _startup_tasks_async_env.lower() not in {
             "0",
@@ -307,3 +399,14 @@ class Config:
             "no",
             "off",
         }
+
+    # Comentário: executa consultas e compila templates em segundo plano logo
+    # após a criação da aplicação para suavizar a primeira requisição. Fica
+    # desligado por padrão: a transação de leitura segura bloqueios que atrasam
+    # migrações, então ative apenas nos processos web (ex.: STARTUP_CACHE_WARMUP=1).
+    STARTUP_CACHE_WARMUP = _ENV.get("STARTUP_CACHE_WARMUP", "0").lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
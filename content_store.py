@@ -0,0 +1,64 @@
+"""Leitura de conteúdos estruturados (JSON) utilizados pela aplicação."""
+
+from __future__ import annotations
+
+from dataclasses import make_dataclass
+import json
+import keyword
+from pathlib import Path
+from types import SimpleNamespace
+
+try:  # pragma: no cover - dependência opcional, mais rápida que o json padrão
+    import orjson
+except ImportError:  # pragma: no cover - ambiente sem orjson instalado
+    orjson = None
+
+
+_RECORD_CLASSES: dict[tuple[str, ...], type | None] = {}
+
+
+def load_content(path: str | Path):
+    """Lê um arquivo JSON como bytes, usando ``orjson`` quando disponível."""
+
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _record_class(keys: tuple[str, ...]) -> type | None:
+    """Retorna uma dataclass imutável e com ``__slots__`` para as chaves dadas.
+
+    As classes são geradas uma única vez por conjunto de chaves. Quando alguma
+    chave não pode ser usada como atributo, retorna ``None`` para que o
+    chamador utilize ``SimpleNamespace``.
+    """
+
+    try:
+        return _RECORD_CLASSES[keys]
+    except KeyError:
+        pass
+
+    record_class = None
+    if all(key.isidentifier() and not keyword.iskeyword(key) for key in keys):
+        record_class = make_dataclass("Registro", keys, frozen=True, slots=True)
+    _RECORD_CLASSES[keys] = record_class
+    return record_class
+
+
+def to_namespace(data):
+    """Converte estruturas de dicionário em objetos com acesso por atributo."""
+
+    if not isinstance(data, dict):
+        return data
+
+    # Comentário: só desce recursivamente nos valores que são dicionários;
+    # os demais são repassados sem uma chamada extra por chave.
+    values = {
+        key: to_namespace(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    }
+    record_class = _record_class(tuple(values))
+    if record_class is None:
+        return SimpleNamespace(**values)
+    return record_class(**values)
@@ -1,56 +1,205 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from flask import Blueprint, render_template, request
 from flask_socketio import emit, join_room
-import random
-import string
+import secrets
+
+try:  # pragma: no cover - dependência opcional
+    import redis
+except ImportError:  # pragma: no cover - executado apenas sem redis instalado
+    redis = None
 
 jogo_bp = Blueprint("jogo", __name__, template_folder="templates", static_folder="static")
 
-rooms: dict[str, dict[str, object]] = {}
+ROOM_KEY_PREFIX = "game:"
+
+# Comentário: salas abandonadas expiram no Redis em vez de ficarem para sempre.
+ROOM_TTL_SECONDS = 6 * 60 * 60
+
+# Comentário: cada fileira é um bitmask (bit k = pausinho k presente) e a largura
+# de cada uma fica separada para reconstruir o tabuleiro enviado ao cliente.
+ROW_WIDTHS = (3, 3, 3, 2, 2)
+
+
+def _full_rows() -> list[int]:
+    return [(1 << width) - 1 for width in ROW_WIDTHS]
+
+
+@dataclass(slots=True)
+class RoomState:
+    """Estado de uma partida; ``__slots__`` evita um dicionário por sala."""
+
+    rows: list[int] = field(default_factory=_full_rows)
+    turn: int = 0
+    # Comentário: contador de pausinhos restantes evita varrer o tabuleiro a cada jogada.
+    remaining: int = sum(ROW_WIDTHS)
+
+
+rooms: dict[str, RoomState] = {}
+
+
+def _public_state(state: RoomState) -> dict[str, object]:
+    """Expande os bitmasks no formato de listas esperado pelo cliente."""
+
+    rows = [
+        [(mask >> k) & 1 for k in range(width)]
+        for mask, width in zip(state.rows, ROW_WIDTHS)
+    ]
+    return {"rows": rows, "turn": state.turn}
+
+
+def _apply_move(state: RoomState, row: int, mask: int) -> None:
+    """Risca os pausinhos da jogada e passa a vez ao outro jogador."""
+
+    struck = state.rows[row] & mask
+    state.rows[row] &= ~mask
+    state.remaining -= bin(struck).count("1")
+    state.turn = 1 - state.turn
+
+
+class _MemoryRoomStore:
+    """Guarda as salas no próprio processo (adequado para um único worker)."""
+
+    def join(self, room: str) -> RoomState:
+        return rooms.setdefault(room, RoomState())
+
+    def move(self, room: str, row: int, mask: int) -> RoomState | None:
+        state = rooms.get(room)
+        if state is None:
+            return None
+        _apply_move(state, row, mask)
+        if state.remaining == 0:
+            rooms.pop(room, None)
+        return state
+
+
+class _RedisRoomStore:
+    """Guarda as salas no Redis para que todos os workers vejam o mesmo tabuleiro.
+
+    Cada jogada lê e grava a sala dentro de WATCH/MULTI: se outro worker alterar
+    a chave no meio do caminho a transação é repetida com o estado novo, então
+    nenhuma jogada se perde e o turno não é alternado duas vezes.
+    """
+
+    def __init__(self, url: str) -> None:
+        self._client = redis.Redis.from_url(url)
+
+    @staticmethod
+    def _decode(data: dict[bytes, bytes]) -> RoomState | None:
+        if not data:
+            return None
+        return RoomState(
+            rows=list(data[b"rows"]),
+            turn=int(data[b"turn"]),
+            remaining=int(data[b"remaining"]),
+        )
+
+    @staticmethod
+    def _write(pipe, key: str, state: RoomState) -> None:
+        # Comentário: cada fileira cabe em um byte, então o tabuleiro vira um único valor.
+        pipe.hset(
+            key,
+            mapping={
+                "rows": bytes(state.rows),
+                "turn": state.turn,
+                "remaining": state.remaining,
+            },
+        )
+        pipe.expire(key, ROOM_TTL_SECONDS)
+
+    def join(self, room: str) -> RoomState:
+        key = ROOM_KEY_PREFIX + room
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    state = self._decode(pipe.hgetall(key))
+                    pipe.multi()
+                    if state is None:
+                        state = RoomState()
+                        self._write(pipe, key, state)
+                    else:
+                        pipe.expire(key, ROOM_TTL_SECONDS)
+                    pipe.execute()
+                    return state
+                except redis.WatchError:
+                    continue
+
+    def move(self, room: str, row: int, mask: int) -> RoomState | None:
+        key = ROOM_KEY_PREFIX + room
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(key)
+                    state = self._decode(pipe.hgetall(key))
+                    if state is None:
+                        pipe.unwatch()
+                        return None
+                    _apply_move(state, row, mask)
+                    pipe.multi()
+                    if state.remaining == 0:
+                        pipe.delete(key)
+                    else:
+                        self._write(pipe, key, state)
+                    pipe.execute()
+                    return state
+                except redis.WatchError:
+                    continue
+
+
+def _room_store(redis_url: str | None):
+    if redis_url and redis is not None:
+        return _RedisRoomStore(redis_url)
+    return _MemoryRoomStore()
+
+
+def _move_mask(row: object, indexes: object) -> int:
+    """Monta o bitmask da jogada ignorando fileiras e posições fora do tabuleiro."""
+
+    if not isinstance(row, int) or not 0 <= row < len(ROW_WIDTHS):
+        return 0
+    if not isinstance(indexes, (list, tuple)):
+        return 0
+    mask = 0
+    for i in indexes:
+        if isinstance(i, int) and 0 <= i < ROW_WIDTHS[row]:
+            mask |= 1 << i
+    return mask
 
 
 @jogo_bp.route("/jogo")
 def jogo() -> str:
-    room_id = request.args.get("room")
-    if not room_id:
-        room_id = "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    room_id = request.args.get("room") or secrets.token_hex(3)
     return render_template("jogo.html", room_id=room_id)
 
 
-def init_socketio(socketio) -> None:
+def init_socketio(socketio, redis_url: str | None = None) -> None:
+    store = _room_store(redis_url)
+
     @socketio.on("join_room")
     def handle_join(data):  # type: ignore[no-redef]
         room = data["room"]
         join_room(room)
-        if room not in rooms:
-            rooms[room] = {
-                "rows": [[1, 1, 1], [1, 1, 1], [1, 1, 1], [1, 1], [1, 1]],
-                "turn": 0,
-            }
-        emit("state_update", rooms[room], to=room)
+        state = store.join(room)
+        emit("state_update", _public_state(state), to=room)
 
     @socketio.on("move")
     def handle_move(data):  # type: ignore[no-redef]
         room = data["room"]
-        row = data["row"]
-        indexes = data["indexes"]
-        state = rooms.get(room)
-        if not state:
+        row = data.get("row")
+        # Comentário: jogadas com posições inválidas são descartadas antes de
+        # alterar o tabuleiro (um índice negativo quebraria o deslocamento).
+        mask = _move_mask(row, data.get("indexes"))
+        if not mask:
+            return
+        # Comentário: a jogada é gravada antes de ser anunciada aos jogadores.
+        state = store.move(room, row, mask)
+        if state is None:
             return
 
-        # risca os pausinhos
-        for i in indexes:
-            if state["rows"][row][i] == 1:
-                state["rows"][row][i] = 0
-
-        # alterna turno
-        state["turn"] = 1 - state["turn"]
+        emit("state_update", _public_state(state), to=room)
 
         # checa fim de jogo
-        if all(all(p == 0 for p in r) for r in state["rows"]):
-            emit("state_update", state, to=room)
+        if state.remaining == 0:
             emit("game_over", to=room)
-            rooms.pop(room, None)
-        else:
-            emit("state_update", state, to=room)
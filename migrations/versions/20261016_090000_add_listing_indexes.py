@@ -0,0 +1,44 @@
+"""add indexes for homepage and footer listings"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_090000"
+down_revision = "20240618_135700"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("ix_homepage_section_active_order", "homepage_section", ["is_active", "display_order", "id"]),
+    ("ix_document_item_order", "document", ["section_item_id", "display_order", "id"]),
+    ("ix_document_active_order", "document", ["is_active", "display_order"]),
+    ("ix_emergency_service_active_order", "emergency_service", ["is_active", "display_order", "id"]),
+    ("ix_footer_column_active_order", "footer_column", ["is_active", "display_order", "id"]),
+    ("ix_quick_link_location_order", "quick_link", ["location", "is_active", "display_order"]),
+    ("ix_quick_link_column_order", "quick_link", ["footer_column_id", "display_order", "id"]),
+    ("ix_section_item_section_order", "section_item", ["section_id", "display_order", "id"]),
+    ("ix_section_item_active_order", "section_item", ["is_active", "display_order"]),
+)
+
+
+def upgrade():
+    # Tabelas criadas por db.create_all já recebem os índices declarados nos modelos.
+    # No PostgreSQL os índices são criados com CONCURRENTLY, fora da transação da
+    # migração, para não bloquear escritas nas tabelas já populadas.
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=concurrently,
+            )
+
+
+def downgrade():
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,89 @@
+"""cascade deletes of section items, documents and footer links in the database"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_100000"
+down_revision = "20261016_090000"
+branch_labels = None
+depends_on = None
+
+
+FOREIGN_KEYS = (
+    ("section_item", "section_id", "homepage_section"),
+    ("document", "section_item_id", "section_item"),
+    ("quick_link", "footer_column_id", "footer_column"),
+)
+
+
+# SQLite não nomeia as chaves estrangeiras; a convenção permite que o modo em
+# lote as encontre ao recriar a tabela.
+SQLITE_NAMING_CONVENTION = {
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+}
+
+
+def _set_sqlite_foreign_keys(enabled):
+    # O PRAGMA é ignorado dentro de uma transação; por isso roda em autocommit.
+    with op.get_context().autocommit_block():
+        op.execute(f"PRAGMA foreign_keys={'ON' if enabled else 'OFF'}")
+
+
+def _recreate_sqlite_foreign_keys(bind, ondelete):
+    # Recriar section_item com as chaves ativas apagaria (ou bloquearia) os
+    # documentos que apontam para ela, então a verificação fica desligada
+    # enquanto as tabelas são copiadas.
+    _set_sqlite_foreign_keys(False)
+    try:
+        for table, column, referred_table in FOREIGN_KEYS:
+            name = f"fk_{table}_{column}_{referred_table}"
+            # Bancos antigos receberam a coluna via ALTER TABLE ADD COLUMN e
+            # não têm chave estrangeira para remover.
+            existing = any(
+                foreign_key["constrained_columns"] == [column]
+                for foreign_key in sa.inspect(bind).get_foreign_keys(table)
+            )
+            with op.batch_alter_table(
+                table,
+                recreate="always",
+                naming_convention=SQLITE_NAMING_CONVENTION,
+            ) as batch_op:
+                if existing:
+                    batch_op.drop_constraint(name, type_="foreignkey")
+                batch_op.create_foreign_key(
+                    name, referred_table, [column], ["id"], ondelete=ondelete
+                )
+    finally:
+        _set_sqlite_foreign_keys(True)
+
+
+def _recreate_foreign_keys(ondelete):
+    bind = op.get_bind()
+
+    if bind.dialect.name == "sqlite":
+        _recreate_sqlite_foreign_keys(bind, ondelete)
+        return
+
+    inspector = sa.inspect(bind)
+    for table, column, referred_table in FOREIGN_KEYS:
+        for foreign_key in inspector.get_foreign_keys(table):
+            if foreign_key["constrained_columns"] == [column] and foreign_key["name"]:
+                op.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+        op.create_foreign_key(
+            f"{table}_{column}_fkey",
+            table,
+            referred_table,
+            [column],
+            ["id"],
+            ondelete=ondelete,
+        )
+
+
+def upgrade():
+    _recreate_foreign_keys("CASCADE")
+
+
+def downgrade():
+    _recreate_foreign_keys(None)
@@ -0,0 +1,87 @@
+"""restrict listing indexes to active rows on postgresql"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_110000"
+down_revision = "20261016_100000"
+branch_labels = None
+depends_on = None
+
+
+# (nome, tabela, colunas parciais, colunas anteriores)
+INDEXES = (
+    (
+        "ix_homepage_section_active_order",
+        "homepage_section",
+        ["display_order", "id"],
+        ["is_active", "display_order", "id"],
+    ),
+    (
+        "ix_document_active_order",
+        "document",
+        ["display_order"],
+        ["is_active", "display_order"],
+    ),
+    (
+        "ix_emergency_service_active_order",
+        "emergency_service",
+        ["display_order", "name"],
+        ["is_active", "display_order", "id"],
+    ),
+    (
+        "ix_footer_column_active_order",
+        "footer_column",
+        ["display_order", "id"],
+        ["is_active", "display_order", "id"],
+    ),
+    (
+        "ix_quick_link_location_order",
+        "quick_link",
+        ["location", "display_order", "id"],
+        ["location", "is_active", "display_order"],
+    ),
+    (
+        "ix_section_item_active_order",
+        "section_item",
+        ["display_order"],
+        ["is_active", "display_order"],
+    ),
+)
+
+
+def _replace_indexes(use_partial):
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, table, partial_columns, previous_columns in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=concurrently,
+            )
+            if use_partial:
+                op.create_index(
+                    name,
+                    table,
+                    partial_columns,
+                    postgresql_where=sa.text("is_active"),
+                    postgresql_concurrently=concurrently,
+                )
+            else:
+                op.create_index(
+                    name,
+                    table,
+                    previous_columns,
+                    postgresql_concurrently=concurrently,
+                )
+
+
+def upgrade():
+    _replace_indexes(use_partial=True)
+
+
+def downgrade():
+    _replace_indexes(use_partial=False)
@@ -2,17 +2,52 @@
 
 from __future__ import annotations
 
+import sqlite3
 from datetime import datetime
 
-from flask import has_request_context, url_for
+from flask import has_request_context, request, url_for
 from flask_login import UserMixin
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declared_attr, relationship
+from werkzeug.security import check_password_hash, generate_password_hash
 
 # Comentário: instância global do SQLAlchemy para ser compartilhada entre módulos.
 db = SQLAlchemy()
 
+# Comentário: prefixos usados para normalizar os caminhos dos documentos.
+EXTERNAL_URL_PREFIXES = ("http://", "https://", "//")
+STATIC_PREFIX = "static/"
+STATIC_PREFIX_LENGTH = len(STATIC_PREFIX)
+DOCUMENTS_PREFIX = "uploads/documents/"
+
+# Comentário: no PostgreSQL os índices das listagens são parciais e guardam apenas
+# as linhas ativas, que são as únicas consultadas pelo site público.
+ACTIVE_ROWS = text("is_active")
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, _connection_record) -> None:
+    """Ativa as chaves estrangeiras no SQLite para respeitar o ON DELETE CASCADE."""
+
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 class AuditMixin:
     """Campos utilitários para registrar autoria e datas de alterações."""
@@ -64,13 +99,9 @@ class User(UserMixin, db.Model):
     )
 
     def set_password(self, password: str) -> None:
-        from werkzeug.security import generate_password_hash
-
         self.password_hash = generate_password_hash(password)
 
     def check_password(self, password: str) -> bool:
-        from werkzeug.security import check_password_hash
-
         return check_password_hash(self.password_hash, password)
 
     def __str__(self) -> str:
@@ -112,6 +143,16 @@ class Page(AuditMixin, db.Model):
 class HomepageSection(AuditMixin, db.Model):
     """Define um agrupamento de cartões exibidos na página inicial."""
 
+    # Comentário: índices alinhados aos filtros e ordenações das listagens públicas.
+    __table_args__ = (
+        Index(
+            "ix_homepage_section_active_order",
+            "display_order",
+            "id",
+            postgresql_where=ACTIVE_ROWS,
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(150), nullable=False)
     slug = Column(String(150), unique=True, nullable=False)
@@ -125,6 +166,8 @@ class HomepageSection(AuditMixin, db.Model):
         back_populates="section",
         order_by=lambda: (SectionItem.display_order, SectionItem.id),
         cascade="all, delete-orphan",
+        # Comentário: a exclusão dos filhos fica a cargo do ON DELETE CASCADE do banco.
+        passive_deletes=True,
     )
 
     def __str__(self) -> str:
@@ -139,12 +182,19 @@ class HomepageSection(AuditMixin, db.Model):
 class Document(AuditMixin, db.Model):
     """Arquivo disponibilizado para download pelos moradores."""
 
+    __table_args__ = (
+        Index("ix_document_item_order", "section_item_id", "display_order", "id"),
+        Index("ix_document_active_order", "display_order", postgresql_where=ACTIVE_ROWS),
+    )
+
     id = Column(Integer, primary_key=True)
     title = Column(String(180), nullable=False)
     description = Column(Text, nullable=True)
     icon_class = Column(String(120), nullable=True)
     file_path = Column(String(255), nullable=False)
-    section_item_id = Column(Integer, ForeignKey("section_item.id"), nullable=True)
+    section_item_id = Column(
+        Integer, ForeignKey("section_item.id", ondelete="CASCADE"), nullable=True
+    )
     display_order = Column(Integer, nullable=False, default=0)
     is_active = Column(Boolean, nullable=False, default=True)
 
@@ -158,74 +208,86 @@ class Document(AuditMixin, db.Model):
     def __repr__(self) -> str:  # pragma: no cover - representação auxiliar
         return f"Documento(título={self.title!r})"
 
+    def _file_path_info(self) -> tuple[bool, str, str, str]:
+        """Deriva os caminhos do documento uma única vez enquanto ``file_path`` não mudar.
+
+        Retorna ``(externo, caminho, nome_do_arquivo, caminho_público)``: URLs
+        absolutas são mantidas como estão; caminhos locais perdem a barra inicial
+        e o prefixo ``static/`` e ganham a pasta de documentos no caminho público.
+        """
+
+        raw_path = self.file_path or ""
+        cached = self.__dict__.get("_file_path_info_cache")
+        if cached is not None and cached[0] == raw_path:
+            return cached[1]
+
+        normalized = raw_path.strip().replace("\\", "/").strip()
+        if not normalized:
+            result = (False, "", "", "")
+        elif normalized.startswith(EXTERNAL_URL_PREFIXES):
+            result = (True, normalized, normalized.rsplit("/", 1)[-1], "")
+        else:
+            normalized = normalized.lstrip("/")
+            if normalized.startswith(STATIC_PREFIX):
+                normalized = normalized[STATIC_PREFIX_LENGTH:]
+            if normalized.startswith(DOCUMENTS_PREFIX):
+                public_path = normalized
+            else:
+                public_path = f"{DOCUMENTS_PREFIX}{normalized}"
+            result = (False, normalized, normalized.rsplit("/", 1)[-1], public_path)
+
+        self.__dict__["_file_path_info_cache"] = (raw_path, result)
+        return result
+
     @property
     def filename(self) -> str:
         """Retorna apenas o nome do arquivo armazenado."""
 
-        file_path = (self.file_path or "").strip()
-        if not file_path:
-            return ""
-
-        normalized = file_path.replace("\\", "/")
-        return normalized.rsplit("/", 1)[-1]
+        return self._file_path_info()[2]
 
     @property
     def public_path(self) -> str:
         """Caminho relativo dentro da pasta estática de documentos."""
 
-        file_path = (self.file_path or "").strip()
-        if not file_path:
-            return ""
-
-        normalized = file_path.replace("\\", "/").strip()
-
-        if normalized.startswith(("http://", "https://", "//")):
-            return ""
-
-        normalized = normalized.lstrip("/")
-
-        static_prefix = "static/"
-        if normalized.startswith(static_prefix):
-            normalized = normalized[len(static_prefix) :]
-
-        documents_prefix = "uploads/documents/"
-        if normalized.startswith(documents_prefix):
-            return normalized
-
-        return f"{documents_prefix}{normalized}"
+        return self._file_path_info()[3]
 
     @property
     def public_url(self) -> str:
         """URL final utilizada nos templates públicos."""
 
-        file_path = (self.file_path or "").strip()
-        if not file_path:
-            return ""
-
-        normalized = file_path.replace("\\", "/").strip()
-
-        if normalized.startswith(("http://", "https://", "//")):
+        is_external, normalized, _filename, relative_path = self._file_path_info()
+        if is_external:
             return normalized
+        if not relative_path:
+            return ""
 
-        normalized = normalized.lstrip("/")
-
-        static_prefix = "static/"
-        if normalized.startswith(static_prefix):
-            normalized = normalized[len(static_prefix) :]
-
-        documents_prefix = "uploads/documents/"
-        if not normalized.startswith(documents_prefix):
-            normalized = f"{documents_prefix}{normalized}"
+        if not has_request_context():
+            return f"/static/{relative_path}"
 
-        if has_request_context():
-            return url_for("static", filename=normalized)
+        # Comentário: a URL só depende do caminho e da raiz da aplicação, então
+        # o resultado de url_for é reaproveitado enquanto ambos não mudarem.
+        cache_key = (relative_path, request.script_root)
+        cached = self.__dict__.get("_public_url_cache")
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
-        return f"/static/{normalized}"
+        url = url_for("static", filename=relative_path)
+        self.__dict__["_public_url_cache"] = (cache_key, url)
+        return url
 
 
 class EmergencyService(AuditMixin, db.Model):
     """Serviço de emergência exibido em destaque na página inicial."""
 
+    __table_args__ = (
+        Index(
+            "ix_emergency_service_active_order",
+            "display_order",
+            "name",
+            postgresql_where=ACTIVE_ROWS,
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     name = Column(String(120), nullable=False)
     phone = Column(String(60), nullable=True)
@@ -246,6 +308,15 @@ class EmergencyService(AuditMixin, db.Model):
 class FooterColumn(AuditMixin, db.Model):
     """Bloco configurável contendo links exibidos no rodapé."""
 
+    __table_args__ = (
+        Index(
+            "ix_footer_column_active_order",
+            "display_order",
+            "id",
+            postgresql_where=ACTIVE_ROWS,
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
     title = Column(String(150), nullable=False)
     display_order = Column(Integer, nullable=False, default=0)
@@ -256,6 +327,7 @@ class FooterColumn(AuditMixin, db.Model):
         back_populates="footer_column",
         order_by="QuickLink.display_order, QuickLink.id",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __str__(self) -> str:
@@ -270,6 +342,17 @@ class FooterColumn(AuditMixin, db.Model):
 class QuickLink(AuditMixin, db.Model):
     """Atalho configurável exibido no acesso rápido ou no rodapé."""
 
+    __table_args__ = (
+        Index(
+            "ix_quick_link_location_order",
+            "location",
+            "display_order",
+            "id",
+            postgresql_where=ACTIVE_ROWS,
+        ),
+        Index("ix_quick_link_column_order", "footer_column_id", "display_order", "id"),
+    )
+
     LOCATION_QUICK_ACCESS = "quick_access"
     LOCATION_FOOTER = "footer"
 
@@ -277,7 +360,9 @@ class QuickLink(AuditMixin, db.Model):
     label = Column(String(150), nullable=False)
     url = Column(String(500), nullable=False)
     location = Column(String(50), nullable=False, default=LOCATION_QUICK_ACCESS)
-    footer_column_id = Column(Integer, ForeignKey("footer_column.id"), nullable=True)
+    footer_column_id = Column(
+        Integer, ForeignKey("footer_column.id", ondelete="CASCADE"), nullable=True
+    )
     display_order = Column(Integer, nullable=False, default=0)
     is_active = Column(Boolean, nullable=False, default=True)
 
@@ -304,8 +389,17 @@ class QuickLink(AuditMixin, db.Model):
 class SectionItem(AuditMixin, db.Model):
     """Representa um cartão individual dentro de uma seção da home."""
 
+    __table_args__ = (
+        Index("ix_section_item_section_order", "section_id", "display_order", "id"),
+        Index(
+            "ix_section_item_active_order", "display_order", postgresql_where=ACTIVE_ROWS
+        ),
+    )
+
     id = Column(Integer, primary_key=True)
-    section_id = Column(Integer, ForeignKey("homepage_section.id"), nullable=False)
+    section_id = Column(
+        Integer, ForeignKey("homepage_section.id", ondelete="CASCADE"), nullable=False
+    )
     title = Column(String(180), nullable=False)
     summary = Column(Text, nullable=True)
     link_url = Column(String(500), nullable=True)
@@ -325,6 +419,7 @@ class SectionItem(AuditMixin, db.Model):
         back_populates="section_item",
         order_by="Document.display_order, Document.id",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __str__(self) -> str:
@@ -7,24 +7,21 @@ import argparse
 import shlex
 import subprocess
 import sys
-from typing import Iterable
+from typing import Sequence
 
 
-def run(command: Iterable[str] | str, description: str) -> None:
-    """Executa um comando do Heroku CLI exibindo logs amigáveis."""
+def run(command: Sequence[str], description: str) -> None:
+    """Executa um comando do Heroku CLI exibindo logs amigáveis.
 
-    if isinstance(command, str):
-        printable = command
-        cmd_list = command
-        shell = True
-    else:
-        printable = " ".join(shlex.quote(part) for part in command)
-        cmd_list = list(command)
-        shell = False
+    O comando é executado diretamente, sem ``/bin/sh`` intermediário, e a saída
+    do Heroku CLI é repassada ao terminal enquanto o passo executa.
+    """
+
+    printable = shlex.join(command)
 
-    print(f"\n▶ {description}\n$ {printable}")
+    print(f"\n▶ {description}\n$ {printable}", flush=True)
     try:
-        subprocess.run(cmd_list, check=True, text=True, shell=shell)
+        subprocess.run(command, check=True)
     except subprocess.CalledProcessError as exc:
         print(f"❌ Falha ao executar: {printable}")
         raise SystemExit(exc.returncode) from exc
@@ -97,6 +94,8 @@ def main() -> None:
     else:
         print("\n▶ Nenhuma variável de ambiente adicional para configurar.")
 
+    # Comentário: a migração só roda depois de confirmar que o add-on definiu o
+    # DATABASE_URL; se a consulta falhar, ``run`` encerra o script aqui.
     run(
         ["heroku", "config:get", "DATABASE_URL", "--app", args.app],
         "Verificando se o DATABASE_URL foi provisionado pelo add-on",
@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 import cloudinary
+import cloudinary.api
 import cloudinary.uploader
 from cloudinary.exceptions import Error as CloudinaryError
 from flask import current_app
 
 
+_EMPTY_CONFIG: Mapping[str, object] = MappingProxyType({})
+
+# Signed delivery URLs carry a ``s--<signature>--`` segment before the asset.
+_SIG_PREFIX = "s--"
+_SIG_SUFFIX = "--"
+
+# Maximum number of public IDs accepted by a single Admin API delete call.
+DELETE_BATCH_SIZE = 100
+
+
 class StorageError(RuntimeError):
     """Raised when a storage operation fails."""
 
@@ -39,8 +52,10 @@ def is_cloudinary_enabled(app=None) -> bool:
     if app is None:
         app = current_app
 
-    config = getattr(app, "extensions", {}).get("cloudinary", {})
-    return bool(config.get("enabled"))
+    # ``init_cloudinary`` stores the flag as a bool, so this is a plain lookup
+    # without allocating fallback dicts on every call.
+    config = getattr(app, "extensions", _EMPTY_CONFIG).get("cloudinary", _EMPTY_CONFIG)
+    return config.get("enabled", False)
 
 
 def upload_to_cloudinary(
@@ -88,52 +103,60 @@ def upload_to_cloudinary(
     return secure_url
 
 
+@lru_cache(maxsize=1024)
 def _extract_public_id(url: str) -> Optional[Tuple[str, str]]:
-    """Extract the resource type and public ID from a Cloudinary URL."""
+    """Extract the resource type and public ID from a Cloudinary URL.
+
+    Results are memoized because the same asset URLs are looked up repeatedly
+    while editing and deleting content in the admin.
+    """
 
     try:
-        parsed = urlparse(url)
+        path = urlparse(url).path
     except ValueError:
         return None
 
-    segments = [segment for segment in parsed.path.split("/") if segment]
-    if len(segments) < 3:
-        return None
-
     # Cloudinary URLs follow the pattern
     # /<cloud_name>/<resource_type>/<delivery_type>/<asset_path>
+    segments = [segment for segment in path.split("/") if segment]
+    if len(segments) < 4:
+        return None
+
     resource_type = segments[1]
     asset_segments = segments[3:]
-    if not asset_segments:
-        return None
 
     # Signed URLs include a signature segment right after the delivery type.
-    if asset_segments and asset_segments[0].startswith("s--") and asset_segments[0].endswith("--"):
+    first_segment = asset_segments[0]
+    if first_segment.startswith(_SIG_PREFIX) and first_segment.endswith(_SIG_SUFFIX):
         asset_segments = asset_segments[1:]
-
-    if not asset_segments:
-        return None
+        if not asset_segments:
+            return None
 
     # Transformations may appear before the optional version segment. We discard
     # them to isolate the actual public ID even when transformations are present.
-    version_index: Optional[int] = None
-    for index, segment in enumerate(asset_segments):
-        if segment.startswith("v") and segment[1:].isdigit():
-            version_index = index
-            break
-
-    if version_index is not None:
+    version_index = next(
+        (
+            index
+            for index, segment in enumerate(asset_segments)
+            if len(segment) > 1 and segment[0] == "v" and segment[1:].isdigit()
+        ),
+        -1,
+    )
+
+    if version_index >= 0:
         asset_segments = asset_segments[version_index + 1 :]
     else:
-        while asset_segments and "," in asset_segments[0]:
-            asset_segments = asset_segments[1:]
+        skip = 0
+        while skip < len(asset_segments) and "," in asset_segments[skip]:
+            skip += 1
+        asset_segments = asset_segments[skip:]
 
     if not asset_segments:
         return None
 
-    last_segment = asset_segments[-1]
-    if "." in last_segment:
-        asset_segments[-1] = last_segment.rsplit(".", 1)[0]
+    stem, dot, _extension = asset_segments[-1].rpartition(".")
+    if dot:
+        asset_segments[-1] = stem
 
     public_id = "/".join(asset_segments)
     if not public_id:
@@ -172,3 +195,46 @@ def delete_cloudinary_asset(url: str, *, resource_type: str) -> bool:
         return False
 
     return True
+
+
+def delete_cloudinary_assets(urls: Iterable[str], *, resource_type: str) -> int:
+    """Delete several Cloudinary assets with batched Admin API calls.
+
+    Returns how many public IDs were accepted for deletion.
+    """
+
+    if not is_cloudinary_enabled():
+        return 0
+
+    public_ids_by_type: dict[str, dict[str, None]] = {}
+    for url in urls:
+        if not url:
+            continue
+        extracted = _extract_public_id(url)
+        if not extracted:
+            continue
+        url_resource_type, public_id = extracted
+        public_ids_by_type.setdefault(resource_type or url_resource_type, {})[
+            public_id
+        ] = None
+
+    deleted = 0
+    for delete_resource_type, public_ids in public_ids_by_type.items():
+        ordered_ids = list(public_ids)
+        for start in range(0, len(ordered_ids), DELETE_BATCH_SIZE):
+            batch = ordered_ids[start : start + DELETE_BATCH_SIZE]
+            try:
+                cloudinary.api.delete_resources(
+                    batch,
+                    resource_type=delete_resource_type,
+                    invalidate=True,
+                )
+            except CloudinaryError as exc:  # pragma: no cover - defensive logging
+                logger = getattr(current_app, "logger", logging.getLogger(__name__))
+                logger.warning(
+                    "Não foi possível excluir arquivos do Cloudinary", exc_info=exc
+                )
+                continue
+            deleted += len(batch)
+
+    return deleted
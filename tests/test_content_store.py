@@ -0,0 +1,36 @@
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from content_store import load_content, to_namespace
+
+
+def test_load_content_reads_utf8_json(tmp_path):
+    path = tmp_path / "conteudo.json"
+    path.write_text('{"titulo": "Orlândia", "itens": [1, 2]}', encoding="utf-8")
+    assert load_content(path) == {"titulo": "Orlândia", "itens": [1, 2]}
+
+
+def test_to_namespace_nested_attributes():
+    stats = to_namespace({"pages": {"total": 3, "published": 2}})
+    assert stats.pages.total == 3
+    assert stats.pages.published == 2
+
+
+def test_to_namespace_reuses_class_per_key_set():
+    first = to_namespace({"total": 1, "active": 0})
+    second = to_namespace({"total": 5, "active": 4})
+    assert type(first) is type(second)
+
+
+def test_to_namespace_invalid_identifier_keys():
+    data = to_namespace({"com-hifen": 1})
+    assert getattr(data, "com-hifen") == 1
+
+
+def test_to_namespace_returns_scalars_unchanged():
+    assert to_namespace([1, 2]) == [1, 2]
+    assert to_namespace("texto") == "texto"
@@ -0,0 +1,92 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import jogo
+from jogo import ROW_WIDTHS, RoomState, _apply_move, _move_mask, _public_state
+
+
+def test_move_mask_builds_bits_for_valid_indexes():
+    assert _move_mask(0, [0, 2]) == 0b101
+
+
+@pytest.mark.parametrize("row", [-1, len(ROW_WIDTHS), "0", None, 1.0])
+def test_move_mask_rejects_invalid_rows(row):
+    assert _move_mask(row, [0]) == 0
+
+
+def test_move_mask_drops_negative_and_out_of_range_indexes():
+    # Comentário: a fileira 3 tem dois pausinhos; -1 e 2 ficam fora do tabuleiro.
+    assert _move_mask(3, [-1, 2, 1]) == 0b10
+
+
+@pytest.mark.parametrize("indexes", [None, "01", [1.0], [-1], []])
+def test_move_mask_ignores_invalid_indexes(indexes):
+    assert _move_mask(0, indexes) == 0
+
+
+def test_apply_move_strikes_sticks_and_passes_turn():
+    state = RoomState()
+
+    _apply_move(state, 1, 0b011)
+
+    assert state.rows[1] == 0b100
+    assert state.remaining == sum(ROW_WIDTHS) - 2
+    assert state.turn == 1
+
+
+def test_apply_move_does_not_count_sticks_already_struck():
+    state = RoomState()
+    _apply_move(state, 0, 0b001)
+
+    _apply_move(state, 0, 0b011)
+
+    assert state.rows[0] == 0b100
+    assert state.remaining == sum(ROW_WIDTHS) - 2
+    assert state.turn == 0
+
+
+def test_apply_move_detects_end_of_game():
+    state = RoomState()
+
+    for row, width in enumerate(ROW_WIDTHS):
+        assert state.remaining > 0
+        _apply_move(state, row, (1 << width) - 1)
+
+    assert state.rows == [0] * len(ROW_WIDTHS)
+    assert state.remaining == 0
+    assert state.turn == len(ROW_WIDTHS) % 2
+
+
+def test_memory_store_removes_finished_room(monkeypatch):
+    monkeypatch.setattr(jogo, "rooms", {})
+    store = jogo._MemoryRoomStore()
+    store.join("sala")
+
+    for row, width in enumerate(ROW_WIDTHS):
+        state = store.move("sala", row, (1 << width) - 1)
+
+    assert state.remaining == 0
+    assert "sala" not in jogo.rooms
+    assert store.move("sala", 0, 0b1) is None
+
+
+def test_public_state_expands_bitmasks():
+    state = RoomState(rows=[0b101, 0b111, 0b000, 0b10, 0b01], turn=1)
+
+    assert _public_state(state) == {
+        "rows": [[1, 0, 1], [1, 1, 1], [0, 0, 0], [0, 1], [1, 0]],
+        "turn": 1,
+    }
+
+
+def test_public_state_of_new_room_is_full_board():
+    assert _public_state(RoomState()) == {
+        "rows": [[1] * width for width in ROW_WIDTHS],
+        "turn": 0,
+    }
@@ -7,6 +7,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from flask import Flask
+
+import storage
 from storage import _extract_public_id
 
 
@@ -58,3 +61,36 @@ def test_extract_public_id_invalid_url():
 
 def test_extract_public_id_incomplete_path():
     assert _extract_public_id("https://res.cloudinary.com/demo/image/upload/") is None
+
+
+def test_delete_cloudinary_assets_batches_by_resource_type(monkeypatch):
+    app = Flask(__name__)
+    app.extensions["cloudinary"] = {"enabled": True}
+    calls = []
+    monkeypatch.setattr(
+        storage.cloudinary.api,
+        "delete_resources",
+        lambda public_ids, **options: calls.append((public_ids, options)),
+    )
+
+    urls = [
+        f"https://res.cloudinary.com/demo/raw/upload/v1/docs/file{index}.pdf"
+        for index in range(150)
+    ]
+    urls.append(urls[0])
+    urls.append("https://example.com/foo/bar")
+
+    with app.app_context():
+        deleted = storage.delete_cloudinary_assets(urls, resource_type="")
+
+    assert deleted == 150
+    assert [len(public_ids) for public_ids, _ in calls] == [100, 50]
+    assert calls[0][0][0] == "docs/file0"
+    assert calls[0][1] == {"resource_type": "raw", "invalidate": True}
+
+
+def test_delete_cloudinary_assets_requires_cloudinary():
+    app = Flask(__name__)
+
+    with app.app_context():
+        assert storage.delete_cloudinary_assets(["https://x"], resource_type="raw") == 0